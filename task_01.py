@@ -1,4 +1,9 @@
-from typing import Optional
+import heapq
+import random
+import time
+import tracemalloc
+from array import array
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
 
 
 class Node:
@@ -24,6 +29,12 @@ class LinkedList:
     def __init__(self) -> None:
         self.head: Optional[Node] = None
 
+    def __iter__(self) -> Iterator[int]:
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
     def insert_at_beginning(self, data: int) -> None:
         """
         Додає вузол з переданим значенням на початок списку.
@@ -96,17 +107,69 @@ class LinkedList:
         tail = dummy
                 
         while l1 and l2:
-            if l1.data < l2.data:
-                tail.next = l1
-                l1 = l1.next
-            else:
+            # При рівних значеннях першим іде вузол з l1, що робить злиття стабільним
+            if l2.data < l1.data:
                 tail.next = l2
                 l2 = l2.next
+            else:
+                tail.next = l1
+                l1 = l1.next
             tail = tail.next
     
         tail.next = l1 if l1 else l2
         return dummy.next  
 
+    def split_after(self, head: Optional[Node], size: int) -> Optional[Node]:
+        """
+        Відрізає від списку перші size вузлів.
+
+        Args:
+            head (Optional[Node]): Головний вузол списку.
+            size (int): Кількість вузлів, що залишаються в першій частині.
+
+        Returns:
+            Optional[Node]: Головний вузол решти списку (або None).
+        """
+        for _ in range(size - 1):
+            if not head:
+                return None
+            head = head.next
+        if not head:
+            return None
+        rest = head.next
+        head.next = None
+        return rest
+
+    def merge_sort(self) -> None:
+        """
+        Сортує однозв'язний список злиттям знизу вгору за O(n log n).
+
+        Сортування виконується на місці, без рекурсії, та є стабільним:
+        на кожному проході сусідні серії довжини width зливаються
+        за допомогою merge_sorted_lists, а width подвоюється.
+        """
+        length = 0
+        current = self.head
+        while current:
+            length += 1
+            current = current.next
+
+        dummy = Node(0)
+        dummy.next = self.head
+        width = 1
+        while width < length:
+            tail = dummy
+            current = dummy.next
+            while current:
+                left = current
+                right = self.split_after(left, width)
+                current = self.split_after(right, width)
+                tail.next = self.merge_sorted_lists(left, right)
+                # Переходимо в кінець щойно злитої серії
+                while tail.next:
+                    tail = tail.next
+            width *= 2
+        self.head = dummy.next
 
     def print_list(self) -> None:
         """
@@ -119,6 +182,376 @@ class LinkedList:
         print("None")
 
 
+NIL = -1  # Індекс, що позначає відсутність наступного вузла
+
+
+class CompactLinkedList:
+    """
+    Компактний однозв'язний список на паралельних масивах array.
+
+    Замість окремого об'єкта Node кожен вузол — це індекс i, для якого
+    data[i] зберігає значення, а next[i] — індекс наступного вузла (або NIL).
+    Звільнені індекси об'єднуються у список вільних комірок і використовуються повторно.
+
+    Атрибути:
+        data (array): Значення вузлів.
+        next (array): Індекси наступних вузлів.
+        head (int): Індекс головного вузла списку (NIL для порожнього списку).
+        tail (int): Індекс останнього вузла списку (NIL для порожнього списку).
+        free (int): Індекс першої вільної комірки (NIL, якщо вільних немає).
+    """
+    def __init__(self, typecode: str = "q") -> None:
+        self.data = array(typecode)
+        self.next = array("q")
+        self.head: int = NIL
+        self.tail: int = NIL
+        self.free: int = NIL
+        self.size: int = 0
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[int], typecode: str = "q") -> "CompactLinkedList":
+        """
+        Створює список з ітерованого об'єкта одним масовим заповненням масивів.
+
+        Args:
+            values (Iterable[int]): Значення вузлів у порядку від голови до хвоста.
+            typecode (str): Код типу array для значень ("q" — цілі, "d" — дійсні).
+
+        Returns:
+            CompactLinkedList: Новий список.
+        """
+        llist = cls(typecode)
+        llist.extend(values)
+        return llist
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        data, nxt = self.data, self.next
+        current = self.head
+        while current != NIL:
+            yield data[current]
+            current = nxt[current]
+
+    def allocate(self, data: int) -> int:
+        """
+        Виділяє комірку для нового вузла, повторно використовуючи вільні.
+
+        Args:
+            data (int): Значення нового вузла.
+
+        Returns:
+            int: Індекс нового вузла.
+        """
+        self.size += 1
+        if self.free != NIL:
+            index = self.free
+            self.free = self.next[index]
+            self.data[index] = data
+            self.next[index] = NIL
+            return index
+        self.data.append(data)
+        self.next.append(NIL)
+        return len(self.data) - 1
+
+    def insert_at_beginning(self, data: int) -> None:
+        """
+        Додає вузол з переданим значенням на початок списку.
+
+        Args:
+            data (int): Значення нового вузла.
+        """
+        index = self.allocate(data)
+        self.next[index] = self.head
+        self.head = index
+        if self.tail == NIL:
+            self.tail = index
+
+    def extend(self, values: Iterable[int]) -> None:
+        """
+        Додає значення в кінець списку, розширюючи масиви одним блоком.
+
+        Args:
+            values (Iterable[int]): Значення нових вузлів.
+        """
+        start = len(self.data)
+        self.data.extend(values)
+        end = len(self.data)
+        if start == end:
+            return
+        # Нові вузли займають суцільний блок, тож посилання — це просто i + 1
+        self.next.extend(range(start + 1, end + 1))
+        self.next[end - 1] = NIL
+        if self.tail == NIL:
+            self.head = start
+        else:
+            self.next[self.tail] = start
+        self.tail = end - 1
+        self.size += end - start
+
+    def pop_front(self) -> int:
+        """
+        Видаляє головний вузол і повертає його комірку до списку вільних.
+
+        Returns:
+            int: Значення видаленого вузла.
+
+        Raises:
+            IndexError: Якщо список порожній.
+        """
+        if self.head == NIL:
+            raise IndexError("pop from empty list")
+        index = self.head
+        self.head = self.next[index]
+        if self.head == NIL:
+            self.tail = NIL
+        self.next[index] = self.free
+        self.free = index
+        self.size -= 1
+        return self.data[index]
+
+    def reverse(self) -> None:
+        """
+        Реверсує список, змінюючи індекси посилань між вузлами.
+        """
+        nxt = self.next
+        prev = NIL
+        current = self.head
+        self.tail = current
+        while current != NIL:
+            next_node = nxt[current]
+            nxt[current] = prev
+            prev = current
+            current = next_node
+        self.head = prev
+
+    def insertion_sort(self) -> None:
+        """
+        Сортує список методом вставок.
+        """
+        sorted_list = NIL
+        current = self.head
+        while current != NIL:
+            next_node = self.next[current]
+            sorted_list = self.sorted_insert(sorted_list, current)
+            current = next_node
+        self.head = sorted_list
+        self.tail = self.find_tail(sorted_list)
+
+    def sorted_insert(self, head_ref: int, new_node: int) -> int:
+        """
+        Вставляє вузол у відсортований список у правильному порядку.
+
+        Args:
+            head_ref (int): Індекс головного вузла відсортованого списку.
+            new_node (int): Індекс вузла, який необхідно вставити.
+
+        Returns:
+            int: Індекс нового головного вузла відсортованого списку.
+        """
+        data, nxt = self.data, self.next
+        if head_ref == NIL or data[head_ref] >= data[new_node]:
+            nxt[new_node] = head_ref
+            return new_node
+        current = head_ref
+        while nxt[current] != NIL and data[nxt[current]] < data[new_node]:
+            current = nxt[current]
+        nxt[new_node] = nxt[current]
+        nxt[current] = new_node
+        return head_ref
+
+    def merge_sorted_lists(self, l1: int, l2: int) -> int:
+        """
+        Об'єднує два відсортовані ланцюжки цього списку в один відсортований.
+
+        Args:
+            l1 (int): Індекс головного вузла першого ланцюжка.
+            l2 (int): Індекс головного вузла другого ланцюжка.
+
+        Returns:
+            int: Індекс головного вузла об'єднаного ланцюжка.
+        """
+        data, nxt = self.data, self.next
+        head = tail = NIL
+        while l1 != NIL and l2 != NIL:
+            # При рівних значеннях першим іде вузол з l1, що робить злиття стабільним
+            if data[l2] < data[l1]:
+                chosen, l2 = l2, nxt[l2]
+            else:
+                chosen, l1 = l1, nxt[l1]
+            if tail == NIL:
+                head = chosen
+            else:
+                nxt[tail] = chosen
+            tail = chosen
+        rest = l1 if l1 != NIL else l2
+        if tail == NIL:
+            return rest
+        nxt[tail] = rest
+        return head
+
+    def merge(self, other: "CompactLinkedList") -> None:
+        """
+        Зливає з цим відсортованим списком інший відсортований список.
+
+        Значення other копіюються у сховище цього списку окремим ланцюжком,
+        після чого ланцюжки об'єднуються через merge_sorted_lists.
+
+        Args:
+            other (CompactLinkedList): Відсортований список для злиття.
+        """
+        start = len(self.data)
+        count = len(other)
+        if count == 0:
+            return
+        self.data.extend(other)
+        self.next.extend(range(start + 1, start + count + 1))
+        self.next[start + count - 1] = NIL
+        self.size += count
+        self.head = self.merge_sorted_lists(self.head, start)
+        self.tail = self.find_tail(self.head)
+
+    def find_tail(self, head: int) -> int:
+        """
+        Знаходить індекс останнього вузла ланцюжка.
+
+        Args:
+            head (int): Індекс головного вузла ланцюжка.
+
+        Returns:
+            int: Індекс останнього вузла (NIL для порожнього ланцюжка).
+        """
+        nxt = self.next
+        if head == NIL:
+            return NIL
+        while nxt[head] != NIL:
+            head = nxt[head]
+        return head
+
+    def print_list(self) -> None:
+        """
+        Виводить елементи списку.
+        """
+        for value in self:
+            print(value, end=" -> ")
+        print("None")
+
+
+def merge_k_sorted(
+    *sources: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    unique: bool = False,
+) -> Iterator[Any]:
+    """
+    Ліниво зливає довільну кількість відсортованих джерел за O(total·log k).
+
+    Джерелами можуть бути LinkedList, CompactLinkedList або будь-які
+    відсортовані ітератори (наприклад, рядки файлів). Одночасно в пам'яті
+    тримається лише по одному поточному елементу з кожного джерела.
+
+    Args:
+        *sources (Iterable[Any]): Відсортовані джерела.
+        key (Optional[Callable[[Any], Any]]): Функція ключа порівняння.
+        reverse (bool): True, якщо джерела відсортовані за спаданням.
+        unique (bool): Пропускати елементи з ключем, рівним попередньому.
+
+    Returns:
+        Iterator[Any]: Генератор злитих значень.
+    """
+    merged = heapq.merge(*sources, key=key, reverse=reverse)
+    if not unique:
+        yield from merged
+        return
+    key_func = key if key is not None else (lambda value: value)
+    previous = sentinel = object()
+    for value in merged:
+        current = key_func(value)
+        if previous is sentinel or current != previous:
+            previous = current
+            yield value
+
+
+def merge_k_sorted_lists(
+    *sources: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    unique: bool = False,
+) -> LinkedList:
+    """
+    Зливає відсортовані джерела в новий однозв'язний список.
+
+    Args:
+        *sources (Iterable[Any]): Відсортовані джерела.
+        key (Optional[Callable[[Any], Any]]): Функція ключа порівняння.
+        reverse (bool): True, якщо джерела відсортовані за спаданням.
+        unique (bool): Пропускати елементи з ключем, рівним попередньому.
+
+    Returns:
+        LinkedList: Злитий відсортований список.
+    """
+    dummy = Node(0)
+    tail = dummy
+    for value in merge_k_sorted(*sources, key=key, reverse=reverse, unique=unique):
+        tail.next = Node(value)
+        tail = tail.next
+    merged_list = LinkedList()
+    merged_list.head = dummy.next
+    return merged_list
+
+
+def benchmark_sorts(sizes: Tuple[int, ...] = (10**3, 10**4, 10**5, 10**6), insertion_limit: int = 10**4) -> None:
+    """
+    Порівнює час роботи insertion_sort та merge_sort на випадкових списках.
+
+    Args:
+        sizes (Tuple[int, ...]): Кількості вузлів у тестових списках.
+        insertion_limit (int): Максимальний розмір, для якого запускається
+            сортування вставками (O(n²) на більших списках працює надто довго).
+    """
+    print(f"{'n':>10} {'insertion_sort, с':>20} {'merge_sort, с':>15}")
+    for n in sizes:
+        values = [random.randint(0, n) for _ in range(n)]
+        timings = []
+        for method in ("insertion_sort", "merge_sort"):
+            if method == "insertion_sort" and n > insertion_limit:
+                timings.append("—")
+                continue
+            llist = LinkedList()
+            for value in values:
+                llist.insert_at_beginning(value)
+            start = time.perf_counter()
+            getattr(llist, method)()
+            timings.append(f"{time.perf_counter() - start:.3f}")
+        print(f"{n:>10} {timings[0]:>20} {timings[1]:>15}")
+
+
+def benchmark_memory(n: int = 10**6) -> None:
+    """
+    Порівнює пам'ять і час побудови LinkedList та CompactLinkedList.
+
+    Args:
+        n (int): Кількість вузлів у тестовому списку.
+    """
+    values = list(range(n))
+    print(f"{'клас':>20} {'побудова, с':>12} {'пам’ять, МБ':>12}")
+    for name in ("LinkedList", "CompactLinkedList"):
+        tracemalloc.start()
+        start = time.perf_counter()
+        if name == "LinkedList":
+            llist = LinkedList()
+            for value in reversed(values):
+                llist.insert_at_beginning(value)
+        else:
+            llist = CompactLinkedList.from_iterable(values)
+        elapsed = time.perf_counter() - start
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:>20} {elapsed:>12.3f} {memory / 2**20:>12.1f}")
+        del llist
+
+
 # Приклад використання
 llist = LinkedList()
 llist.insert_at_beginning(15)
@@ -149,4 +582,27 @@ list2.insert_at_beginning(20)
 merged_list = LinkedList()
 merged_list.head = merged_list.merge_sorted_lists(list1.head, list2.head)
 print("Merged sorted list:")
-merged_list.print_list()
\ No newline at end of file
+merged_list.print_list()
+
+# Сортування злиттям
+llist.insert_at_beginning(1)
+llist.insert_at_beginning(30)
+llist.merge_sort()
+print("Merge sorted list:")
+llist.print_list()
+
+# Компактний список на масивах
+compact = CompactLinkedList.from_iterable([25, 5, 15])
+compact.insert_at_beginning(30)
+compact.reverse()
+print("Compact reversed list:")
+compact.print_list()
+compact.insertion_sort()
+compact.merge(CompactLinkedList.from_iterable([10, 20]))
+print("Compact merged sorted list:")
+compact.print_list()
+
+# K-шляхове злиття відсортованих списків та ітераторів
+kway = merge_k_sorted_lists(merged_list, CompactLinkedList.from_iterable([5, 20, 70]), iter([15, 45]), unique=True)
+print("K-way merged list:")
+kway.print_list()
@@ -1,5 +1,11 @@
 import turtle
 import math
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 
 def draw_tree(branch_length: float, angle: float, level: int) -> None:
@@ -20,17 +26,156 @@ def draw_tree(branch_length: float, angle: float, level: int) -> None:
         turtle.right(angle)
 
         # Рекурсивно малюємо праву гілку
-        draw_tree(branch_length * math.cos(math.radians(angle)), angle, level - 1)
+        child_length = branch_length * rotation_factors(angle)[0]
+        draw_tree(child_length, angle, level - 1)
 
         # Повертаємося та малюємо ліву гілку
         turtle.left(2 * angle)
-        draw_tree(branch_length * math.cos(math.radians(angle)), angle, level - 1)
+        draw_tree(child_length, angle, level - 1)
 
         # Повертаємося у вихідне положення
         turtle.right(angle)
         turtle.backward(branch_length)
 
 
+@lru_cache(maxsize=None)
+def rotation_factors(angle: float) -> Tuple[float, float]:
+    """
+    Обчислює косинус і синус кута розгалуження один раз для кожного кута.
+
+    Args:
+        angle (float): Кут розгалуження гілок у градусах.
+
+    Returns:
+        Tuple[float, float]: Косинус і синус кута.
+    """
+    radians = math.radians(angle)
+    return math.cos(radians), math.sin(radians)
+
+
+def tree_levels(branch_length: float, angle: float, level: int) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Ліниво генерує геометрію дерева Піфагора рівень за рівнем.
+
+    Напрямки гілок зберігаються як одиничні вектори, а дочірні гілки
+    отримуються їх поворотом на ±angle з заздалегідь обчисленими cos і sin,
+    тож тригонометрія не викликається для кожного вузла. У пам'яті
+    одночасно тримається лише поточний рівень.
+
+    Args:
+        branch_length (float): Довжина першої гілки.
+        angle (float): Кут розгалуження гілок у градусах.
+        level (int): Рівень рекурсії, що визначає деталізацію дерева.
+
+    Returns:
+        Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]: Для кожного рівня —
+            масиви початків (n, 2), кінців (n, 2) та довжин гілок (n,).
+    """
+    cos_a, sin_a = rotation_factors(angle)
+    points = np.zeros((1, 2))
+    directions = np.array([[0.0, 1.0]])  # Дерево росте вгору, як і в turtle.left(90)
+    length = branch_length
+    for _ in range(level):
+        ends = points + length * directions
+        yield points, ends, np.full(len(points), length)
+
+        # Кожна гілка породжує праву (поворот на -angle) та ліву (на +angle) гілки
+        dx, dy = directions[:, 0], directions[:, 1]
+        children = np.empty((len(directions), 2, 2))
+        children[:, 0, 0] = dx * cos_a + dy * sin_a
+        children[:, 0, 1] = dy * cos_a - dx * sin_a
+        children[:, 1, 0] = dx * cos_a - dy * sin_a
+        children[:, 1, 1] = dy * cos_a + dx * sin_a
+        directions = children.reshape(-1, 2)
+        points = np.repeat(ends, 2, axis=0)
+        length *= cos_a
+
+
+def tree_segments(branch_length: float, angle: float, level: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Обчислює всі відрізки дерева Піфагора без turtle.
+
+    Args:
+        branch_length (float): Довжина першої гілки.
+        angle (float): Кут розгалуження гілок у градусах.
+        level (int): Рівень рекурсії, що визначає деталізацію дерева.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Масиви початків і кінців відрізків форми (n, 2).
+    """
+    total = max(2 ** level - 1, 0)
+    starts = np.empty((total, 2))
+    ends = np.empty((total, 2))
+    offset = 0
+    for level_starts, level_ends, _ in tree_levels(branch_length, angle, level):
+        count = len(level_starts)
+        starts[offset:offset + count] = level_starts
+        ends[offset:offset + count] = level_ends
+        offset += count
+    return starts, ends
+
+
+def write_tree_levels(filename: str, branch_length: float, angle: float, level: int) -> None:
+    """
+    Потоково записує відрізки дерева у CSV-файл, рівень за рівнем.
+
+    Кожен рядок має формат "level,x0,y0,x1,y1,length". Усе дерево
+    ніколи не тримається в пам'яті, тож можна записувати дуже глибокі дерева.
+
+    Args:
+        filename (str): Шлях до CSV-файлу.
+        branch_length (float): Довжина першої гілки.
+        angle (float): Кут розгалуження гілок у градусах.
+        level (int): Рівень рекурсії, що визначає деталізацію дерева.
+    """
+    with open(filename, "w") as file:
+        file.write("level,x0,y0,x1,y1,length\n")
+        for depth, (starts, ends, lengths) in enumerate(tree_levels(branch_length, angle, level), start=1):
+            rows = np.column_stack((np.full(len(starts), depth), starts, ends, lengths))
+            np.savetxt(file, rows, fmt=["%d", "%.6f", "%.6f", "%.6f", "%.6f", "%.6f"], delimiter=",")
+
+
+def render_tree(
+    branch_length: float,
+    angle: float,
+    level: int,
+    filename: Optional[str] = None,
+    headless: bool = False,
+    linewidth: float = 0.5,
+) -> None:
+    """
+    Малює дерево Піфагора одним пакетом без Turtle.
+
+    Усі відрізки об'єднуються в одну ламану, розділену NaN, тож matplotlib
+    малює їх одним шляхом — це значно швидше за LineCollection з мільйонами шляхів.
+
+    Args:
+        branch_length (float): Довжина першої гілки.
+        angle (float): Кут розгалуження гілок у градусах.
+        level (int): Рівень рекурсії, що визначає деталізацію дерева.
+        filename (Optional[str]): Шлях до файлу (PNG, SVG тощо) для збереження.
+        headless (bool): Не відкривати вікно, лише зберегти файл.
+        linewidth (float): Товщина ліній.
+    """
+    starts, ends = tree_segments(branch_length, angle, level)
+    path = np.full((len(starts), 3, 2), np.nan)
+    path[:, 0] = starts
+    path[:, 1] = ends
+    path = path.reshape(-1, 2)
+
+    # Figure без pyplot не потребує дисплея
+    figure = Figure(figsize=(8, 8)) if headless else plt.figure(figsize=(8, 8))
+    axes = figure.add_subplot()
+    axes.plot(path[:, 0], path[:, 1], color="brown", linewidth=linewidth)
+    axes.set_aspect("equal")
+    axes.axis("off")
+
+    if filename:
+        figure.savefig(filename, dpi=150)
+    if not headless:
+        plt.show()
+
+
 def main() -> None:
     """
     Основна функція для ініціалізації вікна Turtle і запуску малювання фрактального дерева.
@@ -39,6 +184,12 @@ def main() -> None:
         None
     """
     level = int(input("Введіть рівень рекурсії: "))
+    filename = input("Введіть шлях до файлу для збереження (порожньо — малювати у Turtle): ").strip()
+
+    if filename:
+        # Швидкий режим без Turtle та без дисплея
+        render_tree(100, 30, level, filename=filename, headless=True)
+        return
 
     screen = turtle.Screen()
     screen.bgcolor("white")
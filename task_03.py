@@ -1,5 +1,14 @@
 import heapq
-from typing import Dict, List, Tuple
+import mmap
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 
 def add_edge(graph: Dict[int, List[Tuple[int, int]]], u: int, v: int, weight: int) -> None:
@@ -53,6 +62,1009 @@ def dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[int, f
     return distances
 
 
+SNAPSHOT_MAGIC = b"CSRGRAPH"  # Сигнатура бінарного знімка CSR-графа
+
+
+class CSRGraph:
+    """
+    Граф у стисненому розрідженому рядковому форматі (CSR).
+
+    Вершини — цілі числа від 0 до num_vertices - 1. Сусіди вершини v
+    зберігаються в targets[offsets[v]:offsets[v + 1]], а ваги відповідних
+    ребер — у weights з тими самими індексами.
+
+    Атрибути:
+        num_vertices (int): Кількість вершин.
+        offsets (array): Початки списків суміжності, довжина num_vertices + 1.
+        targets (array): Кінцеві вершини ребер.
+        weights (array): Ваги ребер.
+    """
+    def __init__(self, offsets: array, targets: array, weights: array) -> None:
+        self.num_vertices: int = len(offsets) - 1
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_arrays(
+        cls,
+        num_vertices: int,
+        sources: Sequence[int],
+        targets: Sequence[int],
+        weights: Sequence[int],
+        directed: bool = False,
+        weight_typecode: str = "q",
+    ) -> "CSRGraph":
+        """
+        Будує CSR-граф з паралельних масивів ребер сортуванням підрахунком за O(V + E).
+
+        Args:
+            num_vertices (int): Кількість вершин.
+            sources (Sequence[int]): Початкові вершини ребер.
+            targets (Sequence[int]): Кінцеві вершини ребер.
+            weights (Sequence[int]): Ваги ребер.
+            directed (bool): Якщо False, кожне ребро додається в обох напрямках, як у add_edge.
+            weight_typecode (str): Код типу array для ваг ("q" — цілі, "d" — дійсні).
+
+        Returns:
+            CSRGraph: Побудований граф.
+        """
+        # Для неорієнтованого графа кожне ребро проходиться також у зворотному напрямку
+        passes = [(sources, targets)] if directed else [(sources, targets), (targets, sources)]
+
+        counts = [0] * (num_vertices + 1)
+        for tails, _ in passes:
+            for u in tails:
+                counts[u + 1] += 1
+        for v in range(num_vertices):
+            counts[v + 1] += counts[v]
+        offsets = array("q", counts)
+
+        edge_count = counts[-1]
+        csr_targets = array("q", [0]) * edge_count
+        csr_weights = array(weight_typecode, [0]) * edge_count
+        position = counts[:-1]
+        for tails, heads in passes:
+            for u, v, w in zip(tails, heads, weights):
+                index = position[u]
+                csr_targets[index] = v
+                csr_weights[index] = w
+                position[u] = index + 1
+
+        return cls(offsets, csr_targets, csr_weights)
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[int, int, int]],
+        num_vertices: Optional[int] = None,
+        directed: bool = False,
+    ) -> "CSRGraph":
+        """
+        Будує CSR-граф зі списку ребер (u, v, weight).
+
+        Args:
+            edges (Iterable[Tuple[int, int, int]]): Ребра графа.
+            num_vertices (Optional[int]): Кількість вершин (за замовчуванням — максимальний номер + 1).
+            directed (bool): Якщо False, граф неорієнтований.
+
+        Returns:
+            CSRGraph: Побудований граф.
+        """
+        sources = array("q")
+        targets = array("q")
+        weights: List[int] = []
+        for u, v, w in edges:
+            sources.append(u)
+            targets.append(v)
+            weights.append(w)
+        if num_vertices is None:
+            num_vertices = max(max(sources, default=-1), max(targets, default=-1)) + 1
+        return cls.from_arrays(num_vertices, sources, targets, weights, directed=directed)
+
+    @classmethod
+    def from_adjacency(cls, graph: Dict[int, List[Tuple[int, int]]]) -> "CSRGraph":
+        """
+        Перетворює граф у форматі списку суміжності на CSR-граф.
+
+        Args:
+            graph (Dict[int, List[Tuple[int, int]]]): Граф у форматі списку суміжності
+                з вершинами від 0 до n - 1.
+
+        Returns:
+            CSRGraph: Граф з тими самими ребрами.
+        """
+        num_vertices = max(graph, default=-1) + 1
+        sources = array("q")
+        targets = array("q")
+        weights: List[int] = []
+        for u, neighbors in graph.items():
+            for v, w in neighbors:
+                sources.append(u)
+                targets.append(v)
+                weights.append(w)
+        # Список суміжності вже містить обидва напрямки кожного ребра
+        return cls.from_arrays(num_vertices, sources, targets, weights, directed=True)
+
+    @classmethod
+    def from_file(cls, filename: str, directed: bool = False) -> "CSRGraph":
+        """
+        Читає CSR-граф з текстового файлу ребер (CSV, TSV або "u v weight" на рядок).
+
+        Args:
+            filename (str): Шлях до файлу.
+            directed (bool): Якщо False, граф неорієнтований.
+
+        Returns:
+            CSRGraph: Побудований граф.
+        """
+        sources, targets, weights = read_edge_arrays(filename)
+        num_vertices = max(max(sources, default=-1), max(targets, default=-1)) + 1
+        return cls.from_arrays(num_vertices, sources, targets, weights, directed=directed)
+
+    def save(self, filename: str) -> None:
+        """
+        Зберігає граф у бінарний знімок для швидкого повторного завантаження.
+
+        Args:
+            filename (str): Шлях до файлу знімка.
+        """
+        header = array("q", [self.num_vertices, len(self.targets)])
+        with open(filename, "wb") as file:
+            file.write(SNAPSHOT_MAGIC)
+            file.write(self.weights.typecode.encode())
+            file.write(header.tobytes())
+            for column in (self.offsets, self.targets, self.weights):
+                file.write(column.tobytes())
+
+    @classmethod
+    def load(cls, filename: str) -> "CSRGraph":
+        """
+        Завантажує граф з бінарного знімка, збереженого методом save.
+
+        Args:
+            filename (str): Шлях до файлу знімка.
+
+        Returns:
+            CSRGraph: Завантажений граф.
+
+        Raises:
+            ValueError: Якщо файл не є знімком CSR-графа.
+        """
+        with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+                raise ValueError(f"{filename} is not a CSR graph snapshot")
+            position = len(SNAPSHOT_MAGIC)
+            weight_typecode = chr(data[position])
+            position += 1
+
+            header = array("q")
+            header.frombytes(data[position:position + 2 * header.itemsize])
+            position += 2 * header.itemsize
+            num_vertices, num_edges = header
+
+            columns = []
+            for typecode, count in (("q", num_vertices + 1), ("q", num_edges), (weight_typecode, num_edges)):
+                column = array(typecode)
+                end = position + count * column.itemsize
+                column.frombytes(data[position:end])
+                columns.append(column)
+                position = end
+
+        return cls(*columns)
+
+    def neighbors(self, vertex: int) -> Iterable[Tuple[int, int]]:
+        """
+        Повертає сусідів вершини разом з вагами ребер.
+
+        Args:
+            vertex (int): Вершина.
+
+        Returns:
+            Iterable[Tuple[int, int]]: Пари (сусід, вага).
+        """
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return zip(self.targets[start:end], self.weights[start:end])
+
+
+def read_edge_arrays(
+    filename: str,
+    binary: bool = False,
+    chunk_size: int = 1 << 24,
+) -> Tuple[array, array, array]:
+    """
+    Читає файл ребер частинами через mmap у три паралельні масиви.
+
+    Текстовий формат — рядки "u v weight", розділені пробілами, табуляцією або
+    комами (CSV/TSV); рядки, що починаються з "#", пропускаються. Бінарний формат —
+    послідовність трійок (u, v, weight) у вигляді 64-бітних цілих little-endian.
+    Кортеж для кожного ребра не створюється: кожна частина файлу розбирається
+    у плаский масив, з якого зрізами виділяються стовпці.
+
+    Args:
+        filename (str): Шлях до файлу ребер.
+        binary (bool): True для бінарного формату.
+        chunk_size (int): Приблизний розмір частини файлу в байтах.
+
+    Returns:
+        Tuple[array, array, array]: Початкові вершини, кінцеві вершини та ваги ребер.
+
+    Raises:
+        ValueError: Якщо файл містить неповні трійки.
+    """
+    sources, targets, weights = array("q"), array("q"), array("q")
+    with open(filename, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return sources, targets, weights
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            record = 3 * sources.itemsize
+            position = 0
+            while position < size:
+                end = min(position + chunk_size, size)
+                values = array("q")
+                if binary:
+                    # Частина має містити цілу кількість трійок
+                    end = position + max((end - position) // record, 1) * record
+                    values.frombytes(data[position:end])
+                    if sys.byteorder == "big":
+                        values.byteswap()
+                else:
+                    # Частина закінчується на межі рядка
+                    if end < size:
+                        newline = data.rfind(b"\n", position, end)
+                        if newline == -1:
+                            newline = data.find(b"\n", end)
+                        end = size if newline == -1 else newline + 1
+                    chunk = data[position:end]
+                    if b"#" in chunk:
+                        chunk = b"\n".join(line for line in chunk.splitlines() if not line.lstrip().startswith(b"#"))
+                    values.extend(map(int, chunk.replace(b",", b" ").split()))
+                if len(values) % 3:
+                    raise ValueError(f"{filename}: every edge must have exactly three values")
+                sources.extend(values[0::3])
+                targets.extend(values[1::3])
+                weights.extend(values[2::3])
+                position = end
+    return sources, targets, weights
+
+
+def write_binary_edges(filename: str, edges: Iterable[Tuple[int, int, int]]) -> None:
+    """
+    Записує ребра у бінарний формат, який читає read_edge_arrays(binary=True).
+
+    Args:
+        filename (str): Шлях до файлу.
+        edges (Iterable[Tuple[int, int, int]]): Ребра (u, v, weight).
+    """
+    values = array("q")
+    for edge in edges:
+        values.extend(edge)
+    if sys.byteorder == "big":
+        values.byteswap()
+    with open(filename, "wb") as file:
+        values.tofile(file)
+
+
+def load_graph(
+    filename: str,
+    binary: bool = False,
+    directed: bool = False,
+    compact: bool = True,
+) -> Union[CSRGraph, Dict[int, List[Tuple[int, int]]]]:
+    """
+    Завантажує граф з файлу ребер у CSR-формат або у словник суміжності.
+
+    Args:
+        filename (str): Шлях до файлу ребер.
+        binary (bool): True для бінарного формату.
+        directed (bool): Якщо False, граф неорієнтований.
+        compact (bool): True — повернути CSRGraph, False — словник у форматі add_edge.
+
+    Returns:
+        Union[CSRGraph, Dict[int, List[Tuple[int, int]]]]: Завантажений граф.
+    """
+    sources, targets, weights = read_edge_arrays(filename, binary=binary)
+    if compact:
+        num_vertices = max(max(sources, default=-1), max(targets, default=-1)) + 1
+        return CSRGraph.from_arrays(num_vertices, sources, targets, weights, directed=directed)
+
+    graph: Dict[int, List[Tuple[int, int]]] = {}
+    for u, v, w in zip(sources, targets, weights):
+        if directed:
+            graph.setdefault(u, []).append((v, w))
+            graph.setdefault(v, [])
+        else:
+            add_edge(graph, u, v, w)
+    return graph
+
+
+def dijkstra_csr(graph: CSRGraph, start: int) -> Tuple[array, array]:
+    """
+    Алгоритм Дейкстри для CSR-графа з пласкими масивами відстаней і попередників.
+
+    Args:
+        graph (CSRGraph): Граф у форматі CSR.
+        start (int): Початкова вершина.
+
+    Returns:
+        Tuple[array, array]: Масив відстаней (inf для недосяжних вершин) та масив
+            попередників (-1 для стартової та недосяжних вершин).
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = array("d", [float('inf')]) * graph.num_vertices
+    predecessors = array("q", [-1]) * graph.num_vertices
+    distances[start] = 0
+
+    priority_queue: List[Tuple[float, int]] = [(0, start)]
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        if current_distance > distances[current_vertex]:
+            continue
+
+        for index in range(offsets[current_vertex], offsets[current_vertex + 1]):
+            neighbor = targets[index]
+            distance = current_distance + weights[index]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    return distances, predecessors
+
+
+def benchmark_dijkstra(num_vertices: int = 10**5, num_edges: int = 5 * 10**5, seed: int = 42) -> None:
+    """
+    Порівнює словниковий граф і CSR-граф за пам'яттю, часом побудови та часом роботи Дейкстри.
+
+    Args:
+        num_vertices (int): Кількість вершин випадкового графа.
+        num_edges (int): Кількість ребер випадкового графа.
+        seed (int): Зерно генератора випадкових чисел.
+    """
+    rng = random.Random(seed)
+    sources = [rng.randrange(num_vertices) for _ in range(num_edges)]
+    targets = [rng.randrange(num_vertices) for _ in range(num_edges)]
+    weights = [rng.randint(1, 100) for _ in range(num_edges)]
+
+    def build_dict() -> Dict[int, List[Tuple[int, int]]]:
+        graph: Dict[int, List[Tuple[int, int]]] = {}
+        for u, v, w in zip(sources, targets, weights):
+            add_edge(graph, u, v, w)
+        return graph
+
+    def build_csr() -> CSRGraph:
+        return CSRGraph.from_arrays(num_vertices, sources, targets, weights)
+
+    results = []
+    for build in (build_dict, build_csr):
+        # Час і пам'ять вимірюються окремо, бо tracemalloc суттєво сповільнює побудову
+        started = time.perf_counter()
+        built = build()
+        build_time = time.perf_counter() - started
+        del built
+        tracemalloc.start()
+        built = build()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results.append((built, build_time, memory))
+
+    (graph, dict_build, dict_memory), (csr, csr_build, csr_memory) = results
+
+    started = time.perf_counter()
+    dijkstra(graph, sources[0])
+    dict_run = time.perf_counter() - started
+
+    started = time.perf_counter()
+    dijkstra_csr(csr, sources[0])
+    csr_run = time.perf_counter() - started
+
+    print(f"{'граф':>6} {'побудова, с':>12} {'пам’ять, МБ':>12} {'Дейкстра, с':>12}")
+    print(f"{'dict':>6} {dict_build:>12.3f} {dict_memory / 2**20:>12.1f} {dict_run:>12.3f}")
+    print(f"{'CSR':>6} {csr_build:>12.3f} {csr_memory / 2**20:>12.1f} {csr_run:>12.3f}")
+
+
+def reconstruct_path(predecessors: Dict[int, int], target: int) -> List[int]:
+    """
+    Відновлює шлях до вершини за словником попередників.
+
+    Args:
+        predecessors (Dict[int, int]): Попередник кожної досягнутої вершини.
+        target (int): Кінцева вершина шляху.
+
+    Returns:
+        List[int]: Вершини шляху від стартової до target.
+    """
+    path = [target]
+    while path[-1] in predecessors:
+        path.append(predecessors[path[-1]])
+    path.reverse()
+    return path
+
+
+def shortest_path(
+    graph: Dict[int, List[Tuple[int, int]]],
+    source: int,
+    target: int,
+    bidirectional: bool = False,
+) -> Tuple[float, List[int]]:
+    """
+    Знаходить найкоротший шлях між двома вершинами.
+
+    Пошук зупиняється, щойно вершина target остаточно оброблена, тож
+    для близьких вершин переглядається лише мала частина графа.
+
+    Args:
+        graph (Dict[int, List[Tuple[int, int]]]): Граф у форматі списку суміжності.
+        source (int): Початкова вершина.
+        target (int): Кінцева вершина.
+        bidirectional (bool): Шукати одночасно від source і від target
+            (лише для неорієнтованих графів, як ті, що будує add_edge).
+
+    Returns:
+        Tuple[float, List[int]]: Довжина шляху та вершини шляху
+            (inf та порожній список, якщо target недосяжна).
+    """
+    if source == target:
+        return 0, [source]
+    if bidirectional:
+        return bidirectional_dijkstra(graph, source, target)
+
+    distances: Dict[int, float] = {source: 0}
+    predecessors: Dict[int, int] = {}
+    settled = set()
+    priority_queue: List[Tuple[float, int]] = [(0, source)]
+
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        if current_vertex in settled:
+            continue
+        settled.add(current_vertex)
+
+        # Ранній вихід: відстань до target вже остаточна
+        if current_vertex == target:
+            return current_distance, reconstruct_path(predecessors, target)
+
+        for neighbor, weight in graph.get(current_vertex, []):
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    return float('inf'), []
+
+
+def bidirectional_dijkstra(
+    graph: Dict[int, List[Tuple[int, int]]],
+    source: int,
+    target: int,
+) -> Tuple[float, List[int]]:
+    """
+    Двонаправлений алгоритм Дейкстри для неорієнтованого графа.
+
+    Пошуки від source і від target чергуються; робота завершується, коли
+    сума мінімумів обох черг не менша за найкращий знайдений шлях.
+
+    Args:
+        graph (Dict[int, List[Tuple[int, int]]]): Неорієнтований граф у форматі списку суміжності.
+        source (int): Початкова вершина.
+        target (int): Кінцева вершина.
+
+    Returns:
+        Tuple[float, List[int]]: Довжина шляху та вершини шляху
+            (inf та порожній список, якщо target недосяжна).
+    """
+    # Індекс 0 — прямий пошук від source, 1 — зворотний від target
+    distances: List[Dict[int, float]] = [{source: 0}, {target: 0}]
+    predecessors: List[Dict[int, int]] = [{}, {}]
+    settled: List[set] = [set(), set()]
+    queues: List[List[Tuple[float, int]]] = [[(0, source)], [(0, target)]]
+    best = float('inf')
+    meeting: Optional[Tuple[int, int, int]] = None  # (вершина, сусід, напрямок пошуку)
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        current_distance, current_vertex = heapq.heappop(queues[side])
+        if current_vertex in settled[side]:
+            continue
+        settled[side].add(current_vertex)
+
+        own, other = distances[side], distances[1 - side]
+        for neighbor, weight in graph.get(current_vertex, []):
+            distance = current_distance + weight
+            if distance < own.get(neighbor, float('inf')):
+                own[neighbor] = distance
+                predecessors[side][neighbor] = current_vertex
+                heapq.heappush(queues[side], (distance, neighbor))
+            # Ребро, що з'єднує обидва пошуки, може дати коротший шлях
+            if neighbor in other and distance + other[neighbor] < best:
+                best = distance + other[neighbor]
+                meeting = (current_vertex, neighbor, side)
+
+    if meeting is None:
+        return float('inf'), []
+
+    vertex, neighbor, side = meeting
+    if side == 1:
+        vertex, neighbor = neighbor, vertex
+    forward = reconstruct_path(predecessors[0], vertex)
+    backward = reconstruct_path(predecessors[1], neighbor)
+    backward.reverse()
+    return best, forward + backward
+
+
+# Граф, переданий у процес-обробник один раз під час його ініціалізації
+worker_graph: Union[Dict[int, List[Tuple[int, int]]], CSRGraph, None] = None
+
+
+def init_worker(graph: Union[Dict[int, List[Tuple[int, int]]], CSRGraph]) -> None:
+    """
+    Зберігає граф у глобальній змінній процесу-обробника.
+
+    Args:
+        graph (Union[Dict[int, List[Tuple[int, int]]], CSRGraph]): Граф для всіх задач обробника.
+    """
+    global worker_graph
+    worker_graph = graph
+
+
+def worker_dijkstra(sources: List[int]) -> List[Tuple[int, Union[Dict[int, float], array]]]:
+    """
+    Запускає алгоритм Дейкстри для групи стартових вершин у процесі-обробнику.
+
+    Args:
+        sources (List[int]): Стартові вершини.
+
+    Returns:
+        List[Tuple[int, Union[Dict[int, float], array]]]: Пари (стартова вершина, відстані).
+    """
+    graph = worker_graph
+    if isinstance(graph, CSRGraph):
+        return [(source, dijkstra_csr(graph, source)[0]) for source in sources]
+    return [(source, dijkstra(graph, source)) for source in sources]
+
+
+def dijkstra_many(
+    graph: Union[Dict[int, List[Tuple[int, int]]], CSRGraph],
+    sources: Iterable[int],
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> Iterator[Tuple[int, Union[Dict[int, float], array]]]:
+    """
+    Паралельно обчислює найкоротші відстані від багатьох стартових вершин.
+
+    Граф передається кожному процесу один раз через ініціалізатор пулу, а не
+    разом з кожною задачею. Результати повертаються в міру готовності,
+    тож їх порядок може відрізнятися від порядку sources. Якщо генератор
+    закрито достроково, решта задач скасовується.
+
+    Args:
+        graph (Union[Dict[int, List[Tuple[int, int]]], CSRGraph]): Граф у форматі
+            списку суміжності або CSR (останній значно дешевше передавати між процесами).
+        sources (Iterable[int]): Стартові вершини.
+        max_workers (Optional[int]): Кількість процесів (за замовчуванням — кількість ядер).
+        chunksize (int): Кількість стартових вершин в одній задачі.
+
+    Returns:
+        Iterator[Tuple[int, Union[Dict[int, float], array]]]: Пари (стартова вершина,
+            відстані) — словник для списку суміжності або масив для CSR.
+    """
+    sources = list(sources)
+    chunks = [sources[i:i + chunksize] for i in range(0, len(sources), chunksize)]
+    executor = ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker, initargs=(graph,))
+    try:
+        futures = [executor.submit(worker_dijkstra, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        # Якщо споживач зупинився раніше, скасовуємо задачі, що ще не почали виконуватися
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def benchmark_dijkstra_many(
+    num_vertices: int = 2 * 10**4,
+    num_edges: int = 10**5,
+    num_sources: int = 64,
+    seed: int = 42,
+) -> None:
+    """
+    Вимірює прискорення dijkstra_many залежно від кількості процесів.
+
+    Args:
+        num_vertices (int): Кількість вершин випадкового графа.
+        num_edges (int): Кількість ребер випадкового графа.
+        num_sources (int): Кількість стартових вершин.
+        seed (int): Зерно генератора випадкових чисел.
+    """
+    rng = random.Random(seed)
+    graph = CSRGraph.from_arrays(
+        num_vertices,
+        [rng.randrange(num_vertices) for _ in range(num_edges)],
+        [rng.randrange(num_vertices) for _ in range(num_edges)],
+        [rng.randint(1, 100) for _ in range(num_edges)],
+    )
+    sources = rng.sample(range(num_vertices), num_sources)
+
+    started = time.perf_counter()
+    for source in sources:
+        dijkstra_csr(graph, source)
+    serial = time.perf_counter() - started
+    print(f"{'процеси':>8} {'час, с':>8} {'прискорення':>12}")
+    print(f"{'serial':>8} {serial:>8.3f} {1:>12.2f}")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        started = time.perf_counter()
+        for _ in dijkstra_many(graph, sources, max_workers=workers, chunksize=4):
+            pass
+        elapsed = time.perf_counter() - started
+        print(f"{workers:>8} {elapsed:>8.3f} {serial / elapsed:>12.2f}")
+        workers *= 2
+
+
+class CachedGraph:
+    """
+    Обгортка графа, що кешує результати найкоротших шляхів з LRU-витісненням.
+
+    Кешуються як повні результати dijkstra для стартової вершини, так і
+    відповіді shortest_path між парою вершин. Ребра слід додавати через
+    CachedGraph.add_edge, щоб кеш залишався узгодженим з графом.
+
+    Атрибути:
+        graph (Dict[int, List[Tuple[int, int]]]): Граф у форматі списку суміжності.
+        maxsize (int): Максимальна кількість записів у кожному з кешів.
+        hits (int): Кількість влучань у кеш.
+        misses (int): Кількість промахів кешу.
+        evictions (int): Кількість записів, витіснених через обмеження розміру.
+        invalidations (int): Кількість записів, скинутих через зміну графа.
+    """
+    def __init__(self, graph: Optional[Dict[int, List[Tuple[int, int]]]] = None, maxsize: int = 128) -> None:
+        self.graph: Dict[int, List[Tuple[int, int]]] = graph if graph is not None else {}
+        self.maxsize = maxsize
+        self.distances_cache: "OrderedDict[int, Dict[int, float]]" = OrderedDict()
+        self.paths_cache: "OrderedDict[Tuple[int, int], Tuple[float, List[int]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def lookup(self, cache: OrderedDict, key: Any) -> Any:
+        """
+        Повертає значення з кешу (None при промаху) та оновлює лічильники.
+
+        Args:
+            cache (OrderedDict): Кеш для пошуку.
+            key (Any): Ключ запиту.
+
+        Returns:
+            Any: Збережене значення або None.
+        """
+        if key in cache:
+            cache.move_to_end(key)
+            self.hits += 1
+            return cache[key]
+        self.misses += 1
+        return None
+
+    def store(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """
+        Зберігає значення в кеші, витісняючи найдавніше використаний запис.
+
+        Args:
+            cache (OrderedDict): Кеш для запису.
+            key (Any): Ключ запиту.
+            value (Any): Результат запиту.
+        """
+        cache[key] = value
+        if len(cache) > self.maxsize:
+            cache.popitem(last=False)
+            self.evictions += 1
+
+    def dijkstra(self, start: int) -> Dict[int, float]:
+        """
+        Повертає найкоротші відстані від start, використовуючи кеш.
+
+        Повернений словник спільний з кешем, тому його не слід змінювати.
+
+        Args:
+            start (int): Початкова вершина.
+
+        Returns:
+            Dict[int, float]: Найкоротші відстані від стартової вершини до всіх інших вершин.
+        """
+        distances = self.lookup(self.distances_cache, start)
+        if distances is None:
+            distances = dijkstra(self.graph, start)
+            self.store(self.distances_cache, start, distances)
+        return distances
+
+    def shortest_path(self, source: int, target: int) -> Tuple[float, List[int]]:
+        """
+        Повертає найкоротший шлях між двома вершинами, використовуючи кеш.
+
+        Args:
+            source (int): Початкова вершина.
+            target (int): Кінцева вершина.
+
+        Returns:
+            Tuple[float, List[int]]: Довжина шляху та вершини шляху.
+        """
+        key = (source, target)
+        result = self.lookup(self.paths_cache, key)
+        if result is None:
+            result = shortest_path(self.graph, source, target)
+            self.store(self.paths_cache, key, result)
+        return result
+
+    def add_edge(self, u: int, v: int, weight: int) -> None:
+        """
+        Додає ребро до графа та скидає лише ті записи кешу, які воно може змінити.
+
+        Нове ребро лише зменшує відстані, тож результат dijkstra від вершини s
+        залишається правильним, якщо ребро не скорочує шлях ні до u, ні до v.
+        Відповіді для пар вершин скидаються всі, бо для них невідомі відстані до u та v.
+
+        Args:
+            u (int): Перша вершина.
+            v (int): Друга вершина.
+            weight (int): Вага ребра.
+        """
+        add_edge(self.graph, u, v, weight)
+
+        inf = float('inf')
+        for start in list(self.distances_cache):
+            distances = self.distances_cache[start]
+            du, dv = distances.get(u, inf), distances.get(v, inf)
+            if du + weight < dv or dv + weight < du:
+                del self.distances_cache[start]
+                self.invalidations += 1
+            else:
+                # Нові вершини недосяжні, як і решта недосяжних вершин
+                distances.setdefault(u, inf)
+                distances.setdefault(v, inf)
+
+        self.invalidations += len(self.paths_cache)
+        self.paths_cache.clear()
+
+    def clear(self) -> None:
+        """
+        Повністю очищує обидва кеші.
+        """
+        self.invalidations += len(self.distances_cache) + len(self.paths_cache)
+        self.distances_cache.clear()
+        self.paths_cache.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Повертає статистику роботи кешу.
+
+        Returns:
+            Dict[str, int]: Лічильники влучань, промахів, витіснень, скидань та поточний розмір кешів.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "maxsize": self.maxsize,
+            "currsize": len(self.distances_cache) + len(self.paths_cache),
+        }
+
+
+class IndexedHeap:
+    """
+    Індексована бінарна мін-купа вершин з операцією зменшення ключа.
+
+    Для кожної вершини зберігається її позиція в купі, тому кожна вершина
+    присутня в купі не більше одного разу, а зменшення ключа займає O(log n).
+
+    Атрибути:
+        heap (List[int]): Вершини у порядку бінарної купи.
+        keys (Dict[int, float]): Поточний ключ (відстань) кожної вершини в купі.
+        positions (Dict[int, int]): Індекс кожної вершини в списку heap.
+    """
+    def __init__(self) -> None:
+        self.heap: List[int] = []
+        self.keys: Dict[int, float] = {}
+        self.positions: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, vertex: int) -> bool:
+        return vertex in self.positions
+
+    def push(self, vertex: int, key: float) -> None:
+        """
+        Додає вершину або зменшує її ключ, якщо вона вже є в купі.
+
+        Args:
+            vertex (int): Вершина.
+            key (float): Ключ вершини.
+        """
+        if vertex in self.positions:
+            self.decrease_key(vertex, key)
+            return
+        self.heap.append(vertex)
+        self.keys[vertex] = key
+        self.positions[vertex] = len(self.heap) - 1
+        self.sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, vertex: int, key: float) -> None:
+        """
+        Зменшує ключ вершини, що вже знаходиться в купі.
+
+        Args:
+            vertex (int): Вершина.
+            key (float): Новий ключ, не більший за поточний.
+
+        Raises:
+            ValueError: Якщо новий ключ більший за поточний.
+        """
+        if key > self.keys[vertex]:
+            raise ValueError("new key is greater than current key")
+        self.keys[vertex] = key
+        self.sift_up(self.positions[vertex])
+
+    def pop(self) -> Tuple[float, int]:
+        """
+        Видаляє з купи вершину з найменшим ключем.
+
+        Returns:
+            Tuple[float, int]: Ключ і вершина.
+        """
+        heap = self.heap
+        vertex = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self.positions[last] = 0
+            self.sift_down(0)
+        del self.positions[vertex]
+        return self.keys.pop(vertex), vertex
+
+    def sift_up(self, index: int) -> None:
+        """
+        Піднімає вершину з позиції index, доки не відновиться властивість купи.
+
+        Args:
+            index (int): Позиція вершини в купі.
+        """
+        heap, keys, positions = self.heap, self.keys, self.positions
+        vertex = heap[index]
+        key = keys[vertex]
+        while index > 0:
+            parent = (index - 1) // 2
+            if keys[heap[parent]] <= key:
+                break
+            heap[index] = heap[parent]
+            positions[heap[index]] = index
+            index = parent
+        heap[index] = vertex
+        positions[vertex] = index
+
+    def sift_down(self, index: int) -> None:
+        """
+        Опускає вершину з позиції index, доки не відновиться властивість купи.
+
+        Args:
+            index (int): Позиція вершини в купі.
+        """
+        heap, keys, positions = self.heap, self.keys, self.positions
+        size = len(heap)
+        vertex = heap[index]
+        key = keys[vertex]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if key <= keys[heap[child]]:
+                break
+            heap[index] = heap[child]
+            positions[heap[index]] = index
+            index = child
+        heap[index] = vertex
+        positions[vertex] = index
+
+
+def dijkstra_queue(
+    graph: Dict[int, List[Tuple[int, int]]],
+    start: int,
+    queue: str = "heap",
+) -> Tuple[Dict[int, float], int]:
+    """
+    Алгоритм Дейкстри з вибором пріоритетної черги.
+
+    Доступні черги:
+        "heap" — heapq з дублікатами застарілих записів, як у dijkstra;
+        "indexed" — IndexedHeap зі справжнім зменшенням ключа;
+        "dial" — циклічні кошики (алгоритм Діала) для невеликих цілих невід'ємних ваг.
+
+    Args:
+        graph (Dict[int, List[Tuple[int, int]]]): Граф у форматі списку суміжності.
+        start (int): Початкова вершина.
+        queue (str): Тип пріоритетної черги: "heap", "indexed" або "dial".
+
+    Returns:
+        Tuple[Dict[int, float], int]: Найкоротші відстані та максимальний розмір черги.
+
+    Raises:
+        ValueError: Якщо тип черги невідомий або ваги не підходять для "dial".
+    """
+    distances: Dict[int, float] = {vertex: float('inf') for vertex in graph}
+    distances[start] = 0
+    peak = 1
+
+    if queue == "heap":
+        priority_queue: List[Tuple[float, int]] = [(0, start)]
+        while priority_queue:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
+            if current_distance > distances[current_vertex]:
+                continue
+            for neighbor, weight in graph.get(current_vertex, []):
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    heapq.heappush(priority_queue, (distance, neighbor))
+                    peak = max(peak, len(priority_queue))
+
+    elif queue == "indexed":
+        indexed = IndexedHeap()
+        indexed.push(start, 0)
+        while indexed:
+            current_distance, current_vertex = indexed.pop()
+            for neighbor, weight in graph.get(current_vertex, []):
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    indexed.push(neighbor, distance)
+                    peak = max(peak, len(indexed))
+
+    elif queue == "dial":
+        max_weight = 0
+        for neighbors in graph.values():
+            for _, weight in neighbors:
+                if weight < 0 or weight != int(weight):
+                    raise ValueError("dial queue requires non-negative integer weights")
+                max_weight = max(max_weight, int(weight))
+
+        # Відстані всіх вершин у черзі лежать у вікні [current, current + max_weight],
+        # тож достатньо max_weight + 1 кошиків, що використовуються по колу
+        buckets: List[set] = [set() for _ in range(max_weight + 1)]
+        buckets[0].add(start)
+        size = 1
+        current = 0
+        while size:
+            bucket = buckets[current % len(buckets)]
+            while bucket:
+                current_vertex = bucket.pop()
+                size -= 1
+                for neighbor, weight in graph.get(current_vertex, []):
+                    # Цілі ваги у форматі float (наприклад, 2.0) зводимо до int для індексів кошиків
+                    distance = current + int(weight)
+                    if distance < distances[neighbor]:
+                        if distances[neighbor] != float('inf'):
+                            # Зменшення ключа: переносимо вершину до нового кошика
+                            buckets[int(distances[neighbor]) % len(buckets)].discard(neighbor)
+                            size -= 1
+                        distances[neighbor] = distance
+                        buckets[distance % len(buckets)].add(neighbor)
+                        size += 1
+                        peak = max(peak, size)
+            current += 1
+
+    else:
+        raise ValueError(f"unknown queue type: {queue}")
+
+    return distances, peak
+
+
 def main() -> None:
     """
     Основна функція для створення графа, запуску алгоритму Дейкстри та виведення результатів.
@@ -76,6 +1088,10 @@ def main() -> None:
     for vertex, distance in distances.items():
         print(f"Відстань від вершини {start_vertex} до вершини {vertex}: {distance}")
 
+    # Найкоротший шлях між двома вершинами
+    distance, path = shortest_path(graph, start_vertex, 3, bidirectional=True)
+    print(f"Найкоротший шлях від {start_vertex} до 3: {' -> '.join(map(str, path))} (довжина {distance})")
+
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,14 @@
 import uuid
 import heapq
+import operator
+import random
+import sys
+import time
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
 
 class Node:
@@ -11,9 +18,10 @@ class Node:
         self.val = key
         self.color = color
         self.id = str(uuid.uuid4())
+        self.children = []  # Нащадки вузла d-арної купи (для d > 2)
 
 
-def add_edges(graph, node, pos, x=0, y=0, layer=1):
+def add_edges(graph, node, pos, x=0, y=0, layer=1, arity=2):
     if node is not None:
         graph.add_node(node.id, color=node.color, label=node.val)
         if node.left:
@@ -26,13 +34,19 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
             r = x + 1 / 2**layer
             pos[node.right.id] = (r, y - 1)
             add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
+        # Нащадки d-арної купи рівномірно розподіляються під батьківським вузлом
+        for j, child in enumerate(node.children):
+            graph.add_edge(node.id, child.id)
+            c = x + (j - (arity - 1) / 2) * 2 / arity**layer
+            pos[child.id] = (c, y - 1)
+            add_edges(graph, child, pos, x=c, y=y - 1, layer=layer + 1, arity=arity)
     return graph
 
 
-def draw_tree(tree_root):
+def draw_tree(tree_root, arity=2):
     tree = nx.DiGraph()
     pos = {tree_root.id: (0, 0)}
-    tree = add_edges(tree, tree_root, pos)
+    tree = add_edges(tree, tree_root, pos, arity=arity)
 
     colors = [node[1]["color"] for node in tree.nodes(data=True)]
     labels = {node[0]: node[1]["label"] for node in tree.nodes(data=True)}
@@ -43,14 +57,17 @@ def draw_tree(tree_root):
 
 
 # 🔹 Функція перетворення у мін- або макс-купу
-def heapify_array(arr, heap_type="min"):
+def heapify_array(arr, heap_type="min", arity=2):
     """
     Перетворює масив у мін-купу або макс-купу.
 
     :param arr: Вхідний масив чисел
     :param heap_type: "min" для мін-купи, "max" для макс-купи
+    :param arity: Кількість нащадків кожного вузла (2, 4, 8, ...)
     :return: Масив, який відповідає структурі купи
     """
+    if arity != 2:
+        return BinaryHeap(arr, heap_type=heap_type, arity=arity).items
     arr = arr[:]  # Копіюємо масив, щоб не змінювати оригінал
     if heap_type == "min":
         heapq.heapify(arr)  # Мін-купа (за замовчуванням)
@@ -61,11 +78,17 @@ def heapify_array(arr, heap_type="min"):
     return arr
 
 
-# 🔹 Функція побудови бінарної купи з масиву
-def build_heap(arr):
+# 🔹 Функція побудови бінарної (або d-арної) купи з масиву
+def build_heap(arr, arity=2):
     n = len(arr)
     nodes = [Node(val) for val in arr]
 
+    if arity != 2:
+        # Нащадки вузла i у d-арній купі мають індекси d*i + 1 ... d*i + d
+        for i in range(n):
+            nodes[i].children = nodes[arity * i + 1:arity * i + arity + 1]
+        return nodes[0] if nodes else None
+
     for i in range(n // 2):
         if 2 * i + 1 < n:
             nodes[i].left = nodes[2 * i + 1]
@@ -75,9 +98,603 @@ def build_heap(arr):
     return nodes[0] if nodes else None
 
 
+# 🔹 Швидка візуалізація купи безпосередньо з масиву
+def heap_positions(n, arity=2):
+    """
+    Обчислює координати вузлів купи за їхніми індексами в масиві.
+
+    Рівень вузла i — це номер d-арного рівня, до якого потрапляє індекс, а
+    x — позиція вузла всередині рівня, тож розташування збігається з add_edges
+    без рекурсії, networkx та uuid.
+
+    :param n: Кількість вузлів
+    :param arity: Кількість нащадків кожного вузла
+    :return: Масиви x, y (рівень зі знаком мінус) та індексів батьків (-1 для кореня)
+    """
+    indices = np.arange(n)
+    firsts = [0]
+    while firsts[-1] < n:
+        firsts.append(firsts[-1] * arity + 1)  # Індекс першого вузла наступного рівня
+    firsts = np.array(firsts)
+    levels = np.searchsorted(firsts, indices, side="right") - 1
+    widths = np.power(float(arity), levels)
+    xs = 2 * ((indices - firsts[levels] + 0.5) / widths - 0.5)
+    parents = np.where(indices > 0, (indices - 1) // arity, -1)
+    return xs, -levels.astype(float), parents
+
+
+def draw_heap_array(
+    arr,
+    arity=2,
+    colors="skyblue",
+    filename=None,
+    headless=False,
+    max_levels=None,
+    label_limit=64,
+):
+    """
+    Малює купу з масиву пакетними колекціями matplotlib.
+
+    Ребра малюються однією LineCollection, вузли — одним scatter. Підписи
+    додаються лише для невеликих куп, а max_levels обмежує глибину (рівень деталізації).
+
+    :param arr: Масив купи
+    :param arity: Кількість нащадків кожного вузла
+    :param colors: Один колір або список кольорів для кожного вузла
+    :param filename: Шлях до файлу (PNG, SVG тощо) для збереження
+    :param headless: Не відкривати вікно, лише зберегти файл
+    :param max_levels: Максимальна кількість рівнів для відображення
+    :param label_limit: Максимальна кількість вузлів, для якої малюються підписи
+    """
+    n = len(arr)
+    if max_levels is not None:
+        n = min(n, (arity**max_levels - 1) // (arity - 1))
+    xs, ys, parents = heap_positions(n, arity)
+    if not isinstance(colors, str):
+        colors = list(colors)[:n]
+
+    figure = Figure(figsize=(12, 6)) if headless else plt.figure(figsize=(12, 6))
+    axes = figure.add_subplot()
+    if n > 1:
+        children = np.arange(1, n)
+        segments = np.stack(
+            (np.column_stack((xs[parents[1:]], ys[parents[1:]])), np.column_stack((xs[children], ys[children]))),
+            axis=1,
+        )
+        axes.add_collection(LineCollection(segments, colors="gray", linewidths=0.5, zorder=1))
+
+    # Розмір вузла залежить від відстані між сусідами на найширшому рівні
+    widest = arity ** int(-ys.min()) if n else 1
+    spacing = 12 * 72 / widest
+    size = float(np.clip((0.8 * spacing) ** 2, 0.5, 2500))
+    axes.scatter(xs, ys, s=size, c=colors, zorder=2)
+
+    if n <= label_limit:
+        for x, y, value in zip(xs, ys, arr[:n]):
+            axes.annotate(str(value), (x, y), ha="center", va="center", zorder=3)
+
+    axes.set_xlim(-1.05, 1.05)
+    axes.set_ylim(ys.min() - 0.5 if n else -0.5, 0.5)
+    axes.axis("off")
+    if filename:
+        figure.savefig(filename, dpi=150)
+    if not headless:
+        plt.show()
+
+
+# 🔹 Клас змінюваної бінарної купи
+def native_max_functions():
+    """
+    Повертає функції heapq для макс-купи: push, pop, pushpop, replace, heapify.
+
+    У Python 3.14+ використовуються документовані heappush_max тощо. У старіших
+    версіях документованих функцій немає, тож явно (за версією інтерпретатора)
+    використовуються внутрішні _heapify_max, _heappop_max і _heapreplace_max
+    (на C) та _siftdown_max, з яких складаються push і pushpop. Якщо їх
+    немає, повертається None і купа використовує власні sift_up/sift_down.
+
+    :return: Список функцій або None
+    """
+    if sys.version_info >= (3, 14):
+        return [heapq.heappush_max, heapq.heappop_max, heapq.heappushpop_max, heapq.heapreplace_max, heapq.heapify_max]
+
+    # Недокументований API CPython до 3.14: на ньому побудовано heapq.merge(reverse=True),
+    # а в 3.14 ці функції стали публічними. Перевіряємо наявність, а не покладаємося на неї.
+    names = ("_siftdown_max", "_heappop_max", "_heapreplace_max", "_heapify_max")
+    helpers = [getattr(heapq, name, None) for name in names]
+    if not all(helpers):
+        return None
+    siftdown_max, heappop_max, heapreplace_max, heapify_max = helpers
+
+    def heappush_max(heap, item):
+        heap.append(item)
+        siftdown_max(heap, 0, len(heap) - 1)
+
+    def heappushpop_max(heap, item):
+        # Як і heapq.heappushpop: item повертається одразу, якщо він не поступається вершині
+        if heap and item < heap[0]:
+            return heapreplace_max(heap, item)
+        return item
+
+    return [heappush_max, heappop_max, heappushpop_max, heapreplace_max, heapify_max]
+
+
+class BinaryHeap:
+    """
+    Бінарна (або d-арна) купа на пласкому списку з режимами мін-, макс- та купи за ключем.
+
+    Порядок задається порівнянням, а не запереченням значень, тому купа
+    працює з будь-якими порівнюваними елементами без копій. Якщо indexed=True,
+    push і merge повертають дескриптори, а pushpop і replace — пару (вершина,
+    дескриптор нового елемента); за дескриптором можна змінити пріоритет через
+    update або видалити елемент через remove. Початкові елементи в режимі
+    indexed слід додавати через merge, щоб отримати їхні дескриптори.
+    При arity=d нащадки вузла i мають індекси d*i + 1 ... d*i + d: ширша купа
+    нижча, тож pop робить менше переміщень по пам'яті.
+
+    :param items: Початкові елементи (купа будується за O(n)); не підтримується з indexed=True
+    :param heap_type: "min" для мін-купи, "max" для макс-купи
+    :param key: Функція, що обчислює пріоритет елемента
+    :param indexed: Чи підтримувати дескриптори для update та remove
+    :param arity: Кількість нащадків кожного вузла (2, 4, 8, ...)
+    """
+
+    def __init__(self, items=None, heap_type="min", key=None, indexed=False, arity=2):
+        if heap_type not in ("min", "max"):
+            raise ValueError(f"unknown heap type: {heap_type}")
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        if indexed and items is not None:
+            raise ValueError("indexed heap cannot be built from items; use merge() to get the handles")
+        self.heap_type = heap_type
+        self.arity = arity
+        self.key = key
+        self.indexed = indexed
+        self.before = operator.lt if heap_type == "min" else operator.gt
+        self.items = []
+        # Пріоритети зберігаються окремо лише за наявності key, інакше це той самий список
+        self.priorities = [] if key is not None else self.items
+        self.handles = [] if indexed else None
+        self.positions = {}
+        self.next_handle = 0
+        # Для простих мін- і макс-куп використовуємо C-реалізацію heapq
+        self.native = None
+        if key is None and not indexed and arity == 2:
+            if heap_type == "min":
+                self.native = [heapq.heappush, heapq.heappop, heapq.heappushpop, heapq.heapreplace, heapq.heapify]
+            else:
+                self.native = native_max_functions()
+        if items is not None:
+            self.merge(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        return bool(self.items)
+
+    def peek(self):
+        """
+        Повертає найвищий за пріоритетом елемент, не видаляючи його.
+
+        :return: Вершина купи
+        """
+        if not self.items:
+            raise IndexError("peek from empty heap")
+        return self.items[0]
+
+    def push(self, item):
+        """
+        Додає елемент до купи за O(log n).
+
+        :param item: Новий елемент
+        :return: Дескриптор елемента (для indexed=True) або None
+        """
+        if self.native:
+            self.native[0](self.items, item)
+            return None
+        handle = self.append(item)
+        self.sift_up(len(self.items) - 1)
+        return handle
+
+    def pop(self):
+        """
+        Видаляє та повертає найвищий за пріоритетом елемент за O(log n).
+
+        :return: Вершина купи
+        """
+        if not self.items:
+            raise IndexError("pop from empty heap")
+        if self.native:
+            return self.native[1](self.items)
+        return self.remove_at(0)
+
+    def pushpop(self, item):
+        """
+        Додає елемент і одразу видаляє вершину; швидше за push і pop окремо.
+
+        :param item: Новий елемент
+        :return: Найвищий за пріоритетом з вершини купи та item; для indexed=True —
+            пара (цей елемент, дескриптор item або None, якщо item одразу повернуто)
+        """
+        if self.native:
+            return self.native[2](self.items, item)
+        if self.items and self.before(self.priorities[0], self.priority(item)):
+            top = self.items[0]
+            self.forget_top()
+            handle = self.new_handle()
+            self.set_at(0, item, handle)
+            self.sift_down(0)
+            return (top, handle) if self.indexed else top
+        return (item, None) if self.indexed else item
+
+    def replace(self, item):
+        """
+        Видаляє вершину купи і додає новий елемент; розмір купи не змінюється.
+
+        :param item: Новий елемент
+        :return: Попередня вершина купи; для indexed=True — пара (вершина, дескриптор item)
+        """
+        if not self.items:
+            raise IndexError("replace on empty heap")
+        if self.native:
+            return self.native[3](self.items, item)
+        top = self.items[0]
+        self.forget_top()
+        handle = self.new_handle()
+        self.set_at(0, item, handle)
+        self.sift_down(0)
+        return (top, handle) if self.indexed else top
+
+    def merge(self, items):
+        """
+        Додає до купи всі елементи та відновлює її за O(n + m).
+
+        :param items: Ітерований об'єкт або інша BinaryHeap
+        :return: Список дескрипторів доданих елементів (для indexed=True) або None
+        """
+        if isinstance(items, BinaryHeap):
+            items = items.items
+        if self.native:
+            self.items.extend(items)
+            self.native[4](self.items)
+            return None
+        handles = [self.append(item) for item in items]
+        for index in range((len(self.items) - 2) // self.arity, -1, -1):
+            self.sift_down(index)
+        return handles if self.indexed else None
+
+    def update(self, handle, item):
+        """
+        Замінює елемент за дескриптором і відновлює купу (збільшення або зменшення пріоритету).
+
+        :param handle: Дескриптор, повернений push, pushpop, replace або merge
+        :param item: Новий елемент
+        """
+        index = self.positions[handle]
+        self.set_at(index, item, handle)
+        self.sift_up(index)
+        self.sift_down(self.positions[handle])
+
+    def remove(self, handle):
+        """
+        Видаляє елемент за дескриптором.
+
+        :param handle: Дескриптор, повернений push, pushpop, replace або merge
+        :return: Видалений елемент
+        """
+        return self.remove_at(self.positions[handle])
+
+    def priority(self, item):
+        return item if self.key is None else self.key(item)
+
+    def new_handle(self):
+        if not self.indexed:
+            return None
+        self.next_handle += 1
+        return self.next_handle - 1
+
+    def append(self, item):
+        handle = self.new_handle()
+        self.items.append(item)
+        if self.key is not None:
+            self.priorities.append(self.key(item))
+        if self.indexed:
+            self.handles.append(handle)
+            self.positions[handle] = len(self.items) - 1
+        return handle
+
+    def set_at(self, index, item, handle):
+        self.items[index] = item
+        if self.key is not None:
+            self.priorities[index] = self.key(item)
+        if self.indexed:
+            self.handles[index] = handle
+            self.positions[handle] = index
+
+    def forget_top(self):
+        # Дескриптор вершини стає недійсним після її видалення
+        if self.indexed:
+            self.positions.pop(self.handles[0], None)
+
+    def remove_at(self, index):
+        items = self.items
+        item = items[index]
+        if self.indexed:
+            del self.positions[self.handles[index]]
+        last_item = items.pop()
+        last_priority = self.priorities.pop() if self.key is not None else last_item
+        last_handle = self.handles.pop() if self.indexed else None
+        if index < len(items):
+            items[index] = last_item
+            if self.key is not None:
+                self.priorities[index] = last_priority
+            if self.indexed:
+                self.handles[index] = last_handle
+                self.positions[last_handle] = index
+            self.sift_up(index)
+            self.sift_down(index)
+        return item
+
+    def move(self, source, target):
+        self.items[target] = self.items[source]
+        if self.key is not None:
+            self.priorities[target] = self.priorities[source]
+        if self.indexed:
+            self.handles[target] = self.handles[source]
+            self.positions[self.handles[target]] = target
+
+    def sift_up(self, index):
+        items, priorities, before = self.items, self.priorities, self.before
+        item, priority = items[index], priorities[index]
+        handle = self.handles[index] if self.indexed else None
+        plain = self.key is None and not self.indexed
+        arity = self.arity
+        while index > 0:
+            parent = (index - 1) // arity
+            if not before(priority, priorities[parent]):
+                break
+            # Без ключа та дескрипторів переміщуємо лише один список
+            if plain:
+                items[index] = items[parent]
+            else:
+                self.move(parent, index)
+            index = parent
+        self.set_raw(index, item, priority, handle)
+
+    def sift_down(self, index):
+        items, priorities, before = self.items, self.priorities, self.before
+        size = len(items)
+        if index >= size:
+            return
+        item, priority = items[index], priorities[index]
+        handle = self.handles[index] if self.indexed else None
+        plain = self.key is None and not self.indexed
+        arity = self.arity
+        child = arity * index + 1
+        while child < size:
+            # Шукаємо найвищого за пріоритетом серед до arity нащадків
+            for sibling in range(child + 1, min(child + arity, size)):
+                if before(priorities[sibling], priorities[child]):
+                    child = sibling
+            if not before(priorities[child], priority):
+                break
+            if plain:
+                items[index] = items[child]
+            else:
+                self.move(child, index)
+            index = child
+            child = arity * index + 1
+        self.set_raw(index, item, priority, handle)
+
+    def set_raw(self, index, item, priority, handle):
+        self.items[index] = item
+        if self.key is not None:
+            self.priorities[index] = priority
+        if self.indexed:
+            self.handles[index] = handle
+            self.positions[handle] = index
+
+
+# 🔹 Потоковий відбір k найбільших / найменших елементів
+def top_k(items, k, key=None):
+    """
+    Повертає k найбільших елементів потоку, зберігаючи в пам'яті лише k елементів.
+
+    :param items: Ітерований об'єкт (може бути нескінченним генератором, обмеженим ззовні)
+    :param k: Кількість елементів
+    :param key: Функція, що обчислює пріоритет елемента
+    :return: Список k найбільших елементів у спадному порядку
+    """
+    return select_k(items, k, key, largest=True)
+
+
+def bottom_k(items, k, key=None):
+    """
+    Повертає k найменших елементів потоку, зберігаючи в пам'яті лише k елементів.
+
+    :param items: Ітерований об'єкт
+    :param k: Кількість елементів
+    :param key: Функція, що обчислює пріоритет елемента
+    :return: Список k найменших елементів у зростаючому порядку
+    """
+    return select_k(items, k, key, largest=False)
+
+
+def select_k(items, k, key=None, largest=True):
+    """
+    Відбирає k крайніх елементів потоку за допомогою купи розміру k.
+
+    Для найбільших елементів використовується мін-купа: її вершина — найменший
+    з відібраних, і новий елемент витісняє його через pushpop за O(log k).
+
+    :param items: Ітерований об'єкт
+    :param k: Кількість елементів
+    :param key: Функція, що обчислює пріоритет елемента
+    :param largest: True — найбільші, False — найменші
+    :return: Відсортований список відібраних елементів
+    """
+    if k <= 0:
+        return []
+    heap = BinaryHeap(heap_type="min" if largest else "max", key=key)
+    for item in items:
+        if len(heap) < k:
+            heap.push(item)
+        else:
+            heap.pushpop(item)
+    result = [heap.pop() for _ in range(len(heap))]
+    result.reverse()
+    return result
+
+
+class RunningMedian:
+    """
+    Медіана потоку на двох купах: макс-купі нижньої половини та мін-купі верхньої.
+
+    Додавання займає O(log n), отримання медіани — O(1).
+    """
+
+    def __init__(self, items=None):
+        self.lower = BinaryHeap(heap_type="max")
+        self.upper = BinaryHeap(heap_type="min")
+        for item in items or ():
+            self.add(item)
+
+    def __len__(self):
+        return len(self.lower) + len(self.upper)
+
+    def add(self, item):
+        """
+        Додає елемент до потоку.
+
+        :param item: Нове значення
+        """
+        if not self.lower or item <= self.lower.peek():
+            self.lower.push(item)
+        else:
+            self.upper.push(item)
+        # Нижня половина містить стільки ж елементів, скільки верхня, або на один більше
+        if len(self.lower) > len(self.upper) + 1:
+            self.upper.push(self.lower.pop())
+        elif len(self.upper) > len(self.lower):
+            self.lower.push(self.upper.pop())
+
+    def median(self):
+        """
+        Повертає поточну медіану потоку.
+
+        :return: Медіана (середнє двох центральних значень для парної кількості)
+        """
+        if not self.lower:
+            raise IndexError("median of empty stream")
+        if len(self.lower) > len(self.upper):
+            return self.lower.peek()
+        return (self.lower.peek() + self.upper.peek()) / 2
+
+
+def top_k_array(values, k, largest=True, chunk_size=10**6):
+    """
+    Пакетний відбір k крайніх значень масиву NumPy частинами через argpartition.
+
+    Кожна частина скорочується до k кандидатів разом з уже відібраними,
+    тож додаткова пам'ять — O(k + chunk_size).
+
+    :param values: Одновимірний масив NumPy (або memmap)
+    :param k: Кількість значень
+    :param largest: True — найбільші, False — найменші
+    :param chunk_size: Розмір частини масиву
+    :return: Масив відібраних значень, відсортований від крайнього
+    """
+    best = np.empty(0, dtype=values.dtype)
+    if k <= 0:
+        return best
+    for start in range(0, len(values), chunk_size):
+        candidates = np.concatenate((best, values[start:start + chunk_size]))
+        if len(candidates) > k:
+            if largest:
+                candidates = candidates[np.argpartition(candidates, len(candidates) - k)[-k:]]
+            else:
+                candidates = candidates[np.argpartition(candidates, k - 1)[:k]]
+        best = candidates
+    best = np.sort(best)
+    return best[::-1] if largest else best
+
+
+# 🔹 Порівняння BinaryHeap з підходом heapq із запереченням
+def benchmark_heaps(n=10**6, seed=42):
+    """
+    Порівнює побудову та вилучення всіх елементів купи різними способами.
+
+    :param n: Кількість елементів
+    :param seed: Зерно генератора випадкових чисел
+    """
+    rng = random.Random(seed)
+    data = [rng.random() for _ in range(n)]
+
+    def negation_heap():
+        negated = [-x for x in data]
+        heapq.heapify(negated)
+        return negated
+
+    def negation_pop(heap):
+        return -heapq.heappop(heap)
+
+    approaches = [
+        ("heapq + negation", negation_heap, negation_pop),
+        ("BinaryHeap max", lambda: BinaryHeap(data, heap_type="max"), BinaryHeap.pop),
+        ("BinaryHeap min", lambda: BinaryHeap(data, heap_type="min"), BinaryHeap.pop),
+        ("BinaryHeap key", lambda: BinaryHeap(data, key=operator.neg), BinaryHeap.pop),
+    ]
+    print(f"{'підхід':>18} {'побудова, с':>12} {'вилучення, с':>13}")
+    for name, build, pop in approaches:
+        start = time.perf_counter()
+        heap = build()
+        build_time = time.perf_counter() - start
+        start = time.perf_counter()
+        while heap:
+            pop(heap)
+        pop_time = time.perf_counter() - start
+        print(f"{name:>18} {build_time:>12.3f} {pop_time:>13.3f}")
+
+
+def benchmark_arity(sizes=(10**4, 10**5, 10**6), arities=(2, 4, 8), seed=42):
+    """
+    Порівнює пропускну здатність push і pop для куп різної арності.
+
+    Використовується макс-купа за ключем, щоб усі арності працювали
+    на однаковій реалізації на Python (без C-прискорення heapq для d = 2).
+
+    :param sizes: Кількості елементів
+    :param arities: Значення арності d
+    :param seed: Зерно генератора випадкових чисел
+    """
+    rng = random.Random(seed)
+    print(f"{'n':>9} {'d':>3} {'push, оп/с':>12} {'pop, оп/с':>12}")
+    for n in sizes:
+        data = [rng.random() for _ in range(n)]
+        for arity in arities:
+            heap = BinaryHeap(heap_type="max", key=float, arity=arity)
+            start = time.perf_counter()
+            for value in data:
+                heap.push(value)
+            push_rate = n / (time.perf_counter() - start)
+            start = time.perf_counter()
+            while heap:
+                heap.pop()
+            pop_rate = n / (time.perf_counter() - start)
+            print(f"{n:>9} {arity:>3} {push_rate:>12.0f} {pop_rate:>12.0f}")
+
+
 # 🔹 Приклади масивів
 unsorted_array = [15, 3, 17, 20, 8, 5, 2, 10, 12]
 
+# Змінювана макс-купа
+heap = BinaryHeap(unsorted_array, heap_type="max")
+heap.push(25)
+print("BinaryHeap (макс):", heap.items, "вершина:", heap.peek())
+print("3 найбільші:", top_k(unsorted_array, 3), "3 найменші:", bottom_k(unsorted_array, 3))
+print("Медіана:", RunningMedian(unsorted_array).median())
+
 # Мін-купа
 min_heap_array = heapify_array(unsorted_array, "min")
 min_heap_root = build_heap(min_heap_array)
@@ -90,3 +707,8 @@ max_heap_root = build_heap(max_heap_array)
 print("Макс-купа:", max_heap_array)
 draw_tree(max_heap_root)
 
+# 4-арна мін-купа
+quaternary_heap_array = heapify_array(unsorted_array, "min", arity=4)
+quaternary_heap_root = build_heap(quaternary_heap_array, arity=4)
+print("4-арна мін-купа:", quaternary_heap_array)
+draw_tree(quaternary_heap_root, arity=4)
@@ -1,9 +1,18 @@
+import time
 import uuid
+from array import array
+from functools import lru_cache
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
+from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.figure import Figure
 from collections import deque
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Union
+
+FAST_DRAW_THRESHOLD = 200  # Від цієї кількості вузлів дерево малюється без networkx
 
 
 class Node:
@@ -24,6 +33,167 @@ class Node:
         self.id: str = str(uuid.uuid4())  # Унікальний ідентифікатор вузла
 
 
+NIL = -1  # Індекс, що позначає відсутнього нащадка в CompactTree
+
+
+class CompactTree:
+    """
+    Компактне бінарне дерево на паралельних стовпцях array
+
+    Вузол — це цілий індекс i: values[i] зберігає значення, left[i] і right[i] —
+    індекси нащадків (NIL, якщо нащадка немає), colors[i] — колір у форматі 0xRRGGBB.
+    Корінь завжди має індекс 0, а ідентифікатори вузлів нічого не коштують.
+    """
+
+    def __init__(self, with_colors: bool = False) -> None:
+        """
+        Ініціалізація порожнього дерева
+
+        Args:
+            with_colors (bool): Чи зберігати окремий колір для кожного вузла
+        """
+        self.values = array("q")
+        # 32-бітних індексів достатньо для дерев до 2**31 вузлів
+        self.left = array("i")
+        self.right = array("i")
+        # 0xRRGGBB вміщується в 4 байти; "L" на 64-бітному Linux займає 8
+        self.colors: Optional[array] = array("I") if with_colors else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, value: int, color: str = "skyblue") -> int:
+        """
+        Додає вузол без нащадків
+
+        Args:
+            value (int): Значення вузла
+            color (str): Колір вузла (використовується, якщо дерево зберігає кольори)
+
+        Returns:
+            int: Ідентифікатор нового вузла
+        """
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        if self.colors is not None:
+            self.colors.append(int(mcolors.to_hex(color)[1:], 16))
+        return len(self.values) - 1
+
+    def color(self, node: int) -> str:
+        """
+        Повертає колір вузла у 16-ковому форматі
+
+        Args:
+            node (int): Ідентифікатор вузла
+
+        Returns:
+            str: Колір вузла
+        """
+        if self.colors is None:
+            return "skyblue"
+        return f"#{self.colors[node]:06x}"
+
+    @classmethod
+    def complete(cls, values: Iterable[int]) -> "CompactTree":
+        """
+        Будує повне бінарне дерево, заповнюючи його значеннями по рівнях
+
+        Args:
+            values (Iterable[int]): Значення вузлів
+
+        Returns:
+            CompactTree: Побудоване дерево
+        """
+        tree = cls()
+        tree.values.extend(values)
+        n = len(tree.values)
+        tree.left.extend(2 * i + 1 if 2 * i + 1 < n else NIL for i in range(n))
+        tree.right.extend(2 * i + 2 if 2 * i + 2 < n else NIL for i in range(n))
+        return tree
+
+    @classmethod
+    def from_node(cls, tree_root: Optional[Node], with_colors: bool = False) -> "CompactTree":
+        """
+        Перетворює дерево з вузлів Node на компактне дерево
+
+        Ідентифікатори призначаються в порядку обходу в ширину.
+
+        Args:
+            tree_root (Optional[Node]): Кореневий вузол дерева
+            with_colors (bool): Чи переносити кольори вузлів
+
+        Returns:
+            CompactTree: Компактне дерево
+        """
+        tree = cls(with_colors)
+        nodes = list(iter_level_order(tree_root, track_visited=True))
+        index = {id(node): i for i, node in enumerate(nodes)}
+        for node in nodes:
+            tree.add(node.val, node.color)
+        for i, node in enumerate(nodes):
+            if node.left:
+                tree.left[i] = index[id(node.left)]
+            if node.right:
+                tree.right[i] = index[id(node.right)]
+        return tree
+
+    def to_node(self) -> Optional[Node]:
+        """
+        Перетворює компактне дерево на дерево з вузлів Node
+
+        Returns:
+            Optional[Node]: Кореневий вузол дерева
+        """
+        nodes = [Node(value, self.color(i)) for i, value in enumerate(self.values)]
+        for i, node in enumerate(nodes):
+            if self.left[i] != NIL:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != NIL:
+                node.right = nodes[self.right[i]]
+        return nodes[0] if nodes else None
+
+    def preorder(self) -> Iterator[int]:
+        """
+        Обхід у глибину в прямому порядку
+
+        Returns:
+            Iterator[int]: Ідентифікатори вузлів у порядку обходу
+        """
+        left, right = self.left, self.right
+        stack = [0] if len(self) else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if right[node] != NIL:
+                stack.append(right[node])
+            if left[node] != NIL:
+                stack.append(left[node])
+
+    def levels(self) -> Iterator[List[int]]:
+        """
+        Обхід у ширину пакетами по рівнях
+
+        Returns:
+            Iterator[List[int]]: Списки ідентифікаторів вузлів кожного рівня
+        """
+        left, right = self.left, self.right
+        level = [0] if len(self) else []
+        while level:
+            yield level
+            level = [child for node in level for child in (left[node], right[node]) if child != NIL]
+
+    def level_order(self) -> Iterator[int]:
+        """
+        Обхід у ширину
+
+        Returns:
+            Iterator[int]: Ідентифікатори вузлів у порядку обходу
+        """
+        for level in self.levels():
+            yield from level
+
+
 def add_edges(graph: nx.DiGraph, node: Optional[Node], pos: Dict[str, tuple], x: float = 0, y: float = 0, layer: int = 1) -> nx.DiGraph:
     """
     Додає вузли та ребра до графа
@@ -74,84 +244,492 @@ def draw_tree(tree_root: Node, colors_map: Dict[str, str]) -> None:
     plt.show()
 
 
-def generate_colors(n: int) -> List[str]:
+def tree_layout(
+    tree_root: Union[Node, "CompactTree"],
+    max_depth: Optional[int] = None,
+) -> Dict[str, list]:
+    """
+    Ітеративно обчислює координати вузлів за тією ж схемою, що й add_edges
+
+    Args:
+        tree_root (Union[Node, CompactTree]): Кореневий вузол дерева або компактне дерево
+        max_depth (Optional[int]): Максимальна глибина (рівень деталізації)
+
+    Returns:
+        Dict[str, list]: Списки "x", "y", "keys" (id вузлів), "labels", "colors"
+            (власні кольори вузлів) у порядку обходу в ширину та "segments" (ребра)
+    """
+    layout: Dict[str, list] = {"x": [], "y": [], "keys": [], "labels": [], "colors": [], "segments": []}
+
+    if isinstance(tree_root, CompactTree):
+        tree = tree_root
+        start = 0 if len(tree) else None
+        describe = lambda node: (node, tree.values[node], tree.color(node))
+        children = lambda node: (
+            tree.left[node] if tree.left[node] != NIL else None,
+            tree.right[node] if tree.right[node] != NIL else None,
+        )
+    else:
+        start = tree_root
+        describe = lambda node: (node.id, node.val, node.color)
+        children = lambda node: (node.left, node.right)
+
+    queue = deque([(start, 0.0, 0, 1)] if start is not None else [])
+    while queue:
+        node, x, y, layer = queue.popleft()
+        key, label, color = describe(node)
+        layout["x"].append(x)
+        layout["y"].append(y)
+        layout["keys"].append(key)
+        layout["labels"].append(label)
+        layout["colors"].append(color)
+        if max_depth is not None and layer > max_depth - 1:
+            continue
+        for child, direction in zip(children(node), (-1, 1)):
+            if child is not None:
+                child_x = x + direction / 2 ** layer
+                layout["segments"].append(((x, y), (child_x, y - 1)))
+                queue.append((child, child_x, y - 1, layer + 1))
+
+    return layout
+
+
+def plot_layout(figure: Figure, layout: Dict[str, list], colors: list, label_limit: int) -> PathCollection:
+    """
+    Малює обчислене розташування дерева пакетними колекціями matplotlib
+
+    Args:
+        figure (Figure): Фігура для малювання
+        layout (Dict[str, list]): Результат tree_layout
+        colors (list): Кольори вузлів у порядку layout
+        label_limit (int): Максимальна кількість вузлів, для якої малюються підписи
+
+    Returns:
+        PathCollection: Колекція вузлів (для подальшої зміни кольорів)
+    """
+    xs, ys = layout["x"], layout["y"]
+    n = len(ys)
+    axes = figure.add_subplot()
+    axes.add_collection(LineCollection(layout["segments"], colors="gray", linewidths=0.5, zorder=1))
+
+    # Розмір вузла залежить від відстані між сусідами на найглибшому рівні
+    spacing = 12 * 72 / 2 ** (-min(ys)) if n else 12 * 72
+    size = min(max((0.8 * spacing) ** 2, 0.5), 2500)
+    nodes = axes.scatter(xs, ys, s=size, c=colors, zorder=2)
+
+    if len(xs) <= label_limit:
+        for x, y, label in zip(xs, ys, layout["labels"]):
+            axes.annotate(str(label), (x, y), ha="center", va="center", zorder=3)
+
+    axes.set_xlim(-1.05, 1.05)
+    axes.set_ylim(min(ys) - 0.5 if n else -0.5, 0.5)
+    axes.axis("off")
+    return nodes
+
+
+def draw_tree_fast(
+    tree_root: Union[Node, "CompactTree"],
+    colors_map: Dict[Union[str, int], Union[str, np.ndarray]],
+    filename: Optional[str] = None,
+    headless: bool = False,
+    max_depth: Optional[int] = None,
+    label_limit: int = 64,
+) -> None:
+    """
+    Швидко візуалізує велике бінарне дерево без networkx
+
+    Координати обчислюються ітеративно за тією ж схемою, що й в add_edges,
+    ребра малюються однією LineCollection, а вузли — одним scatter.
+
+    Args:
+        tree_root (Union[Node, CompactTree]): Кореневий вузол дерева або компактне дерево
+        colors_map (Dict[Union[str, int], Union[str, np.ndarray]]): Словник кольорів вузлів
+            (рядки або RGBA) за id, для CompactTree — за цілим ідентифікатором
+        filename (Optional[str]): Шлях до файлу (PNG, SVG тощо) для збереження
+        headless (bool): Не відкривати вікно, лише зберегти файл
+        max_depth (Optional[int]): Максимальна глибина для відображення (рівень деталізації)
+        label_limit (int): Максимальна кількість вузлів, для якої малюються підписи
+    """
+    layout = tree_layout(tree_root, max_depth)
+    colors = [colors_map.get(key, color) for key, color in zip(layout["keys"], layout["colors"])]
+
+    figure = Figure(figsize=(12, 6)) if headless else plt.figure(figsize=(12, 6))
+    plot_layout(figure, layout, colors, label_limit)
+    if filename:
+        figure.savefig(filename, dpi=150)
+    if not headless:
+        plt.show()
+
+
+def animate_tree_walk(
+    tree_root: Union[Node, "CompactTree"],
+    visit_order: Union[List[Node], List[int]],
+    filename: Optional[str] = None,
+    headless: bool = False,
+    steps_per_frame: Optional[int] = None,
+    max_frames: int = 50,
+    fps: int = 10,
+    dpi: int = 72,
+    label_limit: int = 64,
+) -> FuncAnimation:
+    """
+    Анімує обхід дерева: на кожному кадрі фарбуються лише щойно відвідані вузли
+
+    Розташування, ребра та колекція вузлів створюються один раз; кадр лише
+    змінює рядки масиву кольорів відповідних вузлів.
+
+    Args:
+        tree_root (Union[Node, CompactTree]): Кореневий вузол дерева або компактне дерево
+        visit_order (Union[List[Node], List[int]]): Порядок відвідування вузлів
+        filename (Optional[str]): Шлях до файлу GIF або MP4 для збереження
+        headless (bool): Не відкривати вікно, лише зберегти файл
+        steps_per_frame (Optional[int]): Скільки кроків обходу показувати за один кадр
+            (за замовчуванням — стільки, щоб кадрів було не більше max_frames)
+        max_frames (int): Максимальна кількість кадрів, якщо steps_per_frame не задано
+        fps (int): Кількість кадрів за секунду
+        dpi (int): Роздільна здатність кадрів у файлі
+        label_limit (int): Максимальна кількість вузлів, для якої малюються підписи
+
+    Returns:
+        FuncAnimation: Об'єкт анімації
+    """
+    layout = tree_layout(tree_root)
+    position = {key: i for i, key in enumerate(layout["keys"])}
+    if isinstance(tree_root, CompactTree):
+        visited = [position[node] for node in visit_order]
+    else:
+        visited = [position[node.id] for node in visit_order]
+    gradient = gradient_rgba(len(visited))
+    face = mcolors.to_rgba_array(layout["colors"])
+    base = face.copy()
+
+    figure = Figure(figsize=(12, 6)) if headless else plt.figure(figsize=(12, 6))
+    nodes = plot_layout(figure, layout, face, label_limit)
+    if steps_per_frame is None:
+        steps_per_frame = max(1, -(-len(visited) // max_frames))
+    # Порожній обхід усе одно дає один кадр — саме дерево
+    frames = max(1, (len(visited) + steps_per_frame - 1) // steps_per_frame)
+
+    def reset() -> Tuple[PathCollection]:
+        # Повертаємо початкові кольори, щоб кожне відтворення чи збереження починалося з чистого дерева
+        face[:] = base
+        nodes.set_facecolor(face)
+        return (nodes,)
+
+    def update(frame: int) -> Tuple[PathCollection]:
+        if frame == 0:
+            reset()
+        start = frame * steps_per_frame
+        end = min(start + steps_per_frame, len(visited))
+        face[visited[start:end]] = gradient[start:end]
+        nodes.set_facecolor(face)
+        return (nodes,)
+
+    animation = FuncAnimation(
+        figure, update, frames=frames, init_func=reset, interval=1000 / fps, blit=True, repeat=False
+    )
+    if filename:
+        writer = "pillow" if filename.lower().endswith(".gif") else "ffmpeg"
+        animation.save(filename, writer=writer, fps=fps, dpi=dpi)
+    if not headless:
+        plt.show()
+    return animation
+
+
+@lru_cache(maxsize=None)
+def gradient_colormap(start: str, end: str) -> mcolors.LinearSegmentedColormap:
+    """
+    Створює (один раз для кожної пари кольорів) градієнтну палітру
+
+    Args:
+        start (str): Початковий колір градієнта
+        end (str): Кінцевий колір градієнта
+
+    Returns:
+        mcolors.LinearSegmentedColormap: Палітра від start до end
+    """
+    return mcolors.LinearSegmentedColormap.from_list("", [start, end])
+
+
+@lru_cache(maxsize=None)
+def gradient_lut(start: str, end: str) -> np.ndarray:
+    """
+    Обчислює (один раз для кожної пари кольорів) таблицю RGBA палітри
+
+    Таблиця має лише colormap.N рядків, тож кеш займає кілька кілобайтів на пару
+    кольорів незалежно від кількості вузлів; масив доступний лише для читання.
+
+    Args:
+        start (str): Початковий колір градієнта
+        end (str): Кінцевий колір градієнта
+
+    Returns:
+        np.ndarray: Масив RGBA форми (colormap.N, 4)
+    """
+    colormap = gradient_colormap(start, end)
+    lut = colormap(np.arange(colormap.N))
+    lut.setflags(write=False)
+    return lut
+
+
+def gradient_rgba(n: int, start: str = "#00008B", end: str = "#ADD8E6") -> np.ndarray:
+    """
+    Обчислює n кольорів градієнта одним векторизованим індексуванням кешованої таблиці палітри
+
+    Індекси обчислюються так само, як у виклику палітри з числами від 0 до 1,
+    тому результат збігається з colormap(np.arange(n) / n).
+
+    Args:
+        n (int): Кількість кольорів
+        start (str): Початковий колір градієнта
+        end (str): Кінцевий колір градієнта
+
+    Returns:
+        np.ndarray: Масив RGBA форми (n, 4)
+    """
+    lut = gradient_lut(start, end)
+    indices = (np.arange(n) / max(n, 1) * len(lut)).astype(np.intp)
+    return lut[np.minimum(indices, len(lut) - 1)]
+
+
+def generate_colors(n: int, start: str = "#00008B", end: str = "#ADD8E6") -> List[str]:
     """
     Генерує список кольорів від темного до світлого
 
     Args:
         n (int): Кількість кольорів для генерації
+        start (str): Початковий (темний) колір
+        end (str): Кінцевий (світлий) колір
 
     Returns:
         List[str]: Список кольорів у 16-ковому форматі
     """
-    return [mcolors.to_hex(mcolors.LinearSegmentedColormap.from_list("", ["#00008B", "#ADD8E6"])(i / n)) for i in range(n)]
+    channels = np.round(gradient_rgba(n, start, end)[:, :3] * 255).astype(np.int64)
+    packed = (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+    return [f"#{value:06x}" for value in packed.tolist()]
 
 
-def dfs(tree_root: Node) -> List[Node]:
+def iter_preorder(tree_root: Optional[Node], track_visited: bool = False) -> Iterator[Node]:
     """
-    Обхід бінарного дерева в глибину (DFS)
+    Ліниво обходить дерево в глибину у прямому порядку (корінь, ліве, праве)
 
     Args:
-        tree_root (Node): Кореневий вузол дерева
+        tree_root (Optional[Node]): Кореневий вузол дерева
+        track_visited (bool): Пропускати повторно досяжні вузли (для структур
+            зі спільними піддеревами); для звичайного дерева не потрібно
 
     Returns:
-        List[Node]: Порядок обходу вузлів
+        Iterator[Node]: Вузли в порядку обходу
     """
+    visited = set() if track_visited else None
     stack = [tree_root]
-    visited = []
-    order = []
-
     while stack:
         node = stack.pop()
-        if node and node not in visited:
-            visited.append(node)
-            order.append(node)
-            if node.right:
-                stack.append(node.right)
-            if node.left:
-                stack.append(node.left)
+        if node is None:
+            continue
+        if visited is not None:
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+        yield node
+        stack.append(node.right)
+        stack.append(node.left)
+
+
+def iter_inorder(tree_root: Optional[Node], track_visited: bool = False) -> Iterator[Node]:
+    """
+    Ліниво обходить дерево в симетричному порядку (ліве, корінь, праве)
+
+    Args:
+        tree_root (Optional[Node]): Кореневий вузол дерева
+        track_visited (bool): Пропускати повторно досяжні вузли (для структур
+            зі спільними піддеревами); для звичайного дерева не потрібно
+
+    Returns:
+        Iterator[Node]: Вузли в порядку обходу
+    """
+    visited = set() if track_visited else None
+    stack: List[Node] = []
+    node = tree_root
+    while stack or node:
+        while node:
+            if visited is not None:
+                if id(node) in visited:
+                    break
+                visited.add(id(node))
+            stack.append(node)
+            node = node.left
+        if not stack:
+            break
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def iter_postorder(tree_root: Optional[Node], track_visited: bool = False) -> Iterator[Node]:
+    """
+    Ліниво обходить дерево у зворотному порядку (ліве, праве, корінь)
+
+    Args:
+        tree_root (Optional[Node]): Кореневий вузол дерева
+        track_visited (bool): Пропускати повторно досяжні вузли (для структур
+            зі спільними піддеревами); для звичайного дерева не потрібно
+
+    Returns:
+        Iterator[Node]: Вузли в порядку обходу
+    """
+    visited = set() if track_visited else None
+    # Прапорець показує, чи вже додані нащадки вузла до стеку
+    stack = [(tree_root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if node is None:
+            continue
+        if expanded:
+            yield node
+        else:
+            if visited is not None:
+                if id(node) in visited:
+                    continue
+                visited.add(id(node))
+            stack.append((node, True))
+            stack.append((node.right, False))
+            stack.append((node.left, False))
+
+
+def iter_level_order(tree_root: Optional[Node], track_visited: bool = False) -> Iterator[Node]:
+    """
+    Ліниво обходить дерево в ширину
+
+    Args:
+        tree_root (Optional[Node]): Кореневий вузол дерева
+        track_visited (bool): Пропускати повторно досяжні вузли
+
+    Returns:
+        Iterator[Node]: Вузли в порядку обходу
+    """
+    for level in iter_levels(tree_root, track_visited):
+        yield from level
+
+
+def iter_levels(tree_root: Optional[Node], track_visited: bool = False) -> Iterator[List[Node]]:
+    """
+    Обходить дерево в ширину, повертаючи вузли пакетами по рівнях
+
+    Args:
+        tree_root (Optional[Node]): Кореневий вузол дерева
+        track_visited (bool): Пропускати повторно досяжні вузли
+
+    Returns:
+        Iterator[List[Node]]: Списки вузлів кожного рівня
+    """
+    visited = set() if track_visited else None
+    level = [tree_root] if tree_root else []
+    while level:
+        if visited is not None:
+            unique = []
+            for node in level:
+                if id(node) not in visited:
+                    visited.add(id(node))
+                    unique.append(node)
+            level = unique
+            if not level:
+                break
+        yield level
+        level = [child for node in level for child in (node.left, node.right) if child]
+
+
+def dfs(tree_root: Union[Node, CompactTree]) -> Union[List[Node], List[int]]:
+    """
+    Обхід бінарного дерева в глибину (DFS)
+
+    Args:
+        tree_root (Union[Node, CompactTree]): Кореневий вузол дерева або компактне дерево
 
-    return order
+    Returns:
+        Union[List[Node], List[int]]: Порядок обходу вузлів (ідентифікатори для CompactTree)
+    """
+    if isinstance(tree_root, CompactTree):
+        return list(tree_root.preorder())
+    return list(iter_preorder(tree_root, track_visited=True))
 
 
-def bfs(tree_root: Node) -> List[Node]:
+def bfs(tree_root: Union[Node, CompactTree]) -> Union[List[Node], List[int]]:
     """
     Обхід бінарного дерева в ширину (BFS)
 
     Args:
-        tree_root (Node): Кореневий вузол дерева
+        tree_root (Union[Node, CompactTree]): Кореневий вузол дерева або компактне дерево
 
     Returns:
-        List[Node]: Порядок обходу вузлів
+        Union[List[Node], List[int]]: Порядок обходу вузлів (ідентифікатори для CompactTree)
     """
-    queue = deque([tree_root])
-    visited = []
-    order = []
+    if isinstance(tree_root, CompactTree):
+        return list(tree_root.level_order())
+    return list(iter_level_order(tree_root, track_visited=True))
 
-    while queue:
-        node = queue.popleft()
-        if node and node not in visited:
-            visited.append(node)
-            order.append(node)
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
 
-    return order
+def build_tree(values: Iterable[int]) -> Optional[Node]:
+    """
+    Будує повне бінарне дерево, заповнюючи його значеннями по рівнях
+
+    Args:
+        values (Iterable[int]): Значення вузлів
+
+    Returns:
+        Optional[Node]: Кореневий вузол дерева
+    """
+    nodes = [Node(value) for value in values]
+    for i, node in enumerate(nodes):
+        if 2 * i + 1 < len(nodes):
+            node.left = nodes[2 * i + 1]
+        if 2 * i + 2 < len(nodes):
+            node.right = nodes[2 * i + 2]
+    return nodes[0] if nodes else None
+
 
+def benchmark_traversals(sizes: Tuple[int, ...] = (10**3, 10**4, 10**5, 10**6)) -> None:
+    """
+    Вимірює час обходів і показує, що він зростає лінійно з кількістю вузлів
 
-def render_tree_walk(tree_root: Node, visit_order: List[Node]) -> None:
+    Args:
+        sizes (Tuple[int, ...]): Кількості вузлів у тестових деревах
+    """
+    traversals = {
+        "preorder": iter_preorder,
+        "inorder": iter_inorder,
+        "postorder": iter_postorder,
+        "level": iter_level_order,
+        "dfs": dfs,
+        "bfs": bfs,
+    }
+    print(f"{'n':>9} " + " ".join(f"{name + ', мкс/вузол':>20}" for name in traversals))
+    for n in sizes:
+        tree_root = build_tree(range(n))
+        timings = []
+        for traversal in traversals.values():
+            start = time.perf_counter()
+            for _ in traversal(tree_root):
+                pass
+            timings.append((time.perf_counter() - start) / n * 1e6)
+        print(f"{n:>9} " + " ".join(f"{timing:>20.3f}" for timing in timings))
+
+
+def render_tree_walk(tree_root: Union[Node, CompactTree], visit_order: Union[List[Node], List[int]]) -> None:
     """
     Візуалізує процес обходу дерева, змінюючи кольори вузлів
 
     Args:
-        tree_root (Node): Кореневий вузол дерева
-        visit_order (List[Node]): Порядок відвідування вузлів
+        tree_root (Union[Node, CompactTree]): Кореневий вузол дерева або компактне дерево
+        visit_order (Union[List[Node], List[int]]): Порядок відвідування вузлів
     """
-    colors = generate_colors(len(visit_order))
-    colors_map = {node.id: colors[i] for i, node in enumerate(visit_order)}
-    draw_tree(tree_root, colors_map)
+    compact = isinstance(tree_root, CompactTree)
+    keys = visit_order if compact else [node.id for node in visit_order]
+    if compact or len(visit_order) > FAST_DRAW_THRESHOLD:
+        # Для великих обходів кольори передаються як рядки RGBA без перетворення в hex
+        draw_tree_fast(tree_root, dict(zip(keys, gradient_rgba(len(visit_order)))))
+    else:
+        draw_tree(tree_root, dict(zip(keys, generate_colors(len(visit_order)))))
 
 
 # Створення дерева
@@ -1,4 +1,10 @@
-from typing import Dict, List, Tuple
+import bisect
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
 
 # Вхідні дані
 items: Dict[str, Dict[str, int]] = {
@@ -12,6 +18,16 @@ items: Dict[str, Dict[str, int]] = {
 
 budget: int = 100
 
+# Максимальна кількість клітинок таблиці ДП, за якої knapsack обирає ДП, а не метод гілок і меж
+DP_CELL_LIMIT: int = 50_000_000
+
+# «Мінус нескінченність» для недосяжних станів таблиці ДП
+NEG_INF: int = -(2 ** 62)
+
+# Кеш таблиць KnapsackTable за хешем набору страв
+TABLE_CACHE: "OrderedDict[str, KnapsackTable]" = OrderedDict()
+TABLE_CACHE_SIZE: int = 16
+
 
 def greedy_algorithm(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[List[str], int]:
     """
@@ -25,7 +41,7 @@ def greedy_algorithm(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[Lis
         Tuple[List[str], int]: Список вибраних страв та загальна калорійність.
     """
     # Відсортовуємо страви за співвідношенням калорій до вартості (спадний порядок)
-    sorted_items = sorted(items.items(), key=lambda x: x[1]['calories'] / x[1]['cost'], reverse=True)
+    sorted_items = sorted(items.items(), key=lambda x: ratio_key(x[1]['cost'], x[1]['calories']), reverse=True)
 
     total_calories: int = 0
     selected_items: List[str] = []
@@ -39,17 +55,24 @@ def greedy_algorithm(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[Lis
     return selected_items, total_calories
 
 
-def dynamic_programming(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[List[str], int]:
+def dynamic_programming(items: Dict[str, Dict[str, int]], budget: int, mode: str = "table") -> Tuple[List[str], int]:
     """
     Алгоритм динамічного програмування для знаходження оптимального вибору страв.
 
     Args:
         items (Dict[str, Dict[str, int]]): Словник, що містить страви, їхню вартість і калорійність.
         budget (int): Доступний бюджет.
+        mode (str): "table" — повна таблиця (n+1) × (budget+1) на списках Python;
+            "numpy" — один рядок NumPy, що оновлюється векторизовано (див. dynamic_programming_numpy).
 
     Returns:
         Tuple[List[str], int]: Список вибраних страв та максимальна калорійність.
     """
+    if mode == "numpy":
+        return dynamic_programming_numpy(items, budget)
+    if mode != "table":
+        raise ValueError(f"unknown mode: {mode}")
+
     n: int = len(items)
     dp: List[List[int]] = [[0 for _ in range(budget + 1)] for _ in range(n + 1)]
     item_list: List[Tuple[str, Dict[str, int]]] = list(items.items())
@@ -77,6 +100,472 @@ def dynamic_programming(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[
     return selected_items, dp[n][budget]
 
 
+def knapsack_row(costs: np.ndarray, calories: np.ndarray, budget: int) -> np.ndarray:
+    """
+    Обчислює останній рядок таблиці ДП одним рядком, що оновлюється для кожної страви.
+
+    Args:
+        costs (np.ndarray): Вартості страв.
+        calories (np.ndarray): Калорійності страв.
+        budget (int): Доступний бюджет.
+
+    Returns:
+        np.ndarray: Максимальна калорійність для кожного бюджету від 0 до budget.
+    """
+    dp = np.zeros(budget + 1, dtype=np.int64)
+    for cost, value in zip(costs.tolist(), calories.tolist()):
+        if cost <= budget:
+            # Зсунутий рядок обчислюється до оновлення, тож кожна страва береться не більше одного разу
+            np.maximum(dp[cost:], dp[:budget + 1 - cost] + value, out=dp[cost:])
+    return dp
+
+
+def hirschberg_select(costs: np.ndarray, calories: np.ndarray, indices: np.ndarray, budget: int) -> List[int]:
+    """
+    Відновлює оптимальний набір страв методом «розділяй і володарюй» з пам'яттю O(budget).
+
+    Страви діляться навпіл; для кожної половини обчислюється рядок ДП, і бюджет
+    розподіляється між половинами так, щоб сума калорій була максимальною.
+
+    Args:
+        costs (np.ndarray): Вартості всіх страв.
+        calories (np.ndarray): Калорійності всіх страв.
+        indices (np.ndarray): Індекси страв поточної підзадачі.
+        budget (int): Бюджет поточної підзадачі.
+
+    Returns:
+        List[int]: Індекси вибраних страв.
+    """
+    selected: List[int] = []
+    stack = [(indices, budget)]
+    while stack:
+        part, part_budget = stack.pop()
+        if len(part) == 0 or part_budget < 0:
+            continue
+        if len(part) == 1:
+            index = int(part[0])
+            if costs[index] <= part_budget and calories[index] > 0:
+                selected.append(index)
+            continue
+        middle = len(part) // 2
+        left, right = part[:middle], part[middle:]
+        left_row = knapsack_row(costs[left], calories[left], part_budget)
+        right_row = knapsack_row(costs[right], calories[right], part_budget)
+        split = int(np.argmax(left_row + right_row[::-1]))
+        stack.append((left, split))
+        stack.append((right, part_budget - split))
+    return selected
+
+
+def select_items(costs: np.ndarray, calories: np.ndarray, budget: int, max_choice_bytes: int = 256 * 2**20) -> Tuple[List[int], int]:
+    """
+    Розв'язує задачу 0/1 над масивами вартостей і калорійностей одним рядком NumPy.
+
+    Кожна страва застосовується до рядка векторизованим зсунутим np.maximum.
+    Для відновлення набору зберігається бітова матриця рішень (n × (budget+1) біт);
+    якщо вона більша за max_choice_bytes, набір відновлюється методом Гіршберга
+    з пам'яттю O(budget).
+
+    Args:
+        costs (np.ndarray): Вартості страв.
+        calories (np.ndarray): Калорійності страв.
+        budget (int): Доступний бюджет.
+        max_choice_bytes (int): Максимальний розмір бітової матриці рішень у байтах.
+
+    Returns:
+        Tuple[List[int], int]: Індекси вибраних страв (від останньої до першої) та максимальна калорійність.
+    """
+    n = len(costs)
+    if n == 0 or budget < 0:
+        return [], 0
+
+    if n * (budget + 1) / 8 > max_choice_bytes:
+        selected = sorted(hirschberg_select(costs, calories, np.arange(n), budget), reverse=True)
+        return selected, int(calories[selected].sum())
+
+    dp = np.zeros(budget + 1, dtype=np.int64)
+    choices = np.zeros((n, (budget + 8) // 8), dtype=np.uint8)
+    for i, (cost, value) in enumerate(zip(costs.tolist(), calories.tolist())):
+        if cost > budget:
+            continue
+        candidate = dp[:budget + 1 - cost] + value
+        # Як і в табличній версії, страва береться лише за строгого покращення
+        take = np.zeros(budget + 1, dtype=bool)
+        take[cost:] = candidate > dp[cost:]
+        choices[i] = np.packbits(take)
+        np.maximum(dp[cost:], candidate, out=dp[cost:])
+
+    selected: List[int] = []
+    b = budget
+    for i in range(n - 1, -1, -1):
+        if (choices[i, b >> 3] >> (7 - (b & 7))) & 1:
+            selected.append(i)
+            b -= int(costs[i])
+
+    return selected, int(dp[budget])
+
+
+def dynamic_programming_numpy(
+    items: Dict[str, Dict[str, int]],
+    budget: int,
+    max_choice_bytes: int = 256 * 2**20,
+) -> Tuple[List[str], int]:
+    """
+    Динамічне програмування з одним рядком NumPy замість повної таблиці (див. select_items).
+
+    Args:
+        items (Dict[str, Dict[str, int]]): Словник, що містить страви, їхню вартість і калорійність.
+        budget (int): Доступний бюджет.
+        max_choice_bytes (int): Максимальний розмір бітової матриці рішень у байтах.
+
+    Returns:
+        Tuple[List[str], int]: Список вибраних страв та максимальна калорійність.
+    """
+    item_list: List[Tuple[str, Dict[str, int]]] = list(items.items())
+    costs = np.array([info['cost'] for _, info in item_list], dtype=np.int64)
+    calories = np.array([info['calories'] for _, info in item_list], dtype=np.int64)
+    selected, total = select_items(costs, calories, budget, max_choice_bytes)
+    return [item_list[i][0] for i in selected], total
+
+
+def split_items(items: Dict[str, Dict[str, int]], budget: int, kind: str = "single") -> List[Tuple[str, int, int, int]]:
+    """
+    Зводить задачу з кратностями до задачі 0/1 двійковим розбиттям.
+
+    Страва з кількістю q розбивається на частини 1, 2, 4, ..., залишок, тож
+    будь-яку кількість від 0 до q можна скласти з O(log q) частин.
+
+    Args:
+        items (Dict[str, Dict[str, int]]): Словник страв; необов'язковий ключ 'quantity' задає
+            максимальну кількість страви для kind="bounded" (за замовчуванням 1).
+        budget (int): Доступний бюджет.
+        kind (str): "single" — кожна страва не більше одного разу, "bounded" — не більше
+            'quantity' разів, "unbounded" — без обмеження кількості.
+
+    Returns:
+        List[Tuple[str, int, int, int]]: Частини у вигляді (назва, кількість, вартість, калорійність).
+    """
+    if kind not in ("single", "bounded", "unbounded"):
+        raise ValueError(f"unknown kind: {kind}")
+
+    pieces: List[Tuple[str, int, int, int]] = []
+    for name, info in items.items():
+        cost, calories = info['cost'], info['calories']
+        if kind == "single":
+            quantity = 1
+        elif kind == "bounded":
+            quantity = info.get('quantity', 1)
+        elif cost > 0:
+            quantity = budget // cost
+        elif calories > 0:
+            raise ValueError(f"item {name!r} has zero cost and cannot be taken unboundedly")
+        else:
+            quantity = 0
+
+        part = 1
+        while quantity > 0:
+            count = min(part, quantity)
+            pieces.append((name, count, cost * count, calories * count))
+            quantity -= count
+            part *= 2
+    return pieces
+
+
+def ratio_key(cost: int, calories: int) -> float:
+    """
+    Співвідношення калорій до вартості, за яким жадібний алгоритм впорядковує страви.
+
+    Args:
+        cost (int): Вартість страви.
+        calories (int): Калорійність страви.
+
+    Returns:
+        float: Калорії на одиницю вартості (нескінченність для безкоштовних страв).
+    """
+    return calories / cost if cost else math.inf
+
+
+def branch_and_bound(costs: np.ndarray, calories: np.ndarray, budget: int) -> Tuple[List[int], int]:
+    """
+    Точний метод гілок і меж для задачі 0/1, що не залежить від розміру бюджету.
+
+    Страви впорядковуються за співвідношенням калорій до вартості, як у жадібному
+    алгоритмі, а верхня межа вузла — розв'язок дробової задачі для решти страв.
+    Межа обчислюється за O(log n) бінарним пошуком у префіксних сумах.
+
+    Args:
+        costs (np.ndarray): Вартості страв.
+        calories (np.ndarray): Калорійності страв.
+        budget (int): Доступний бюджет.
+
+    Returns:
+        Tuple[List[int], int]: Індекси вибраних страв та максимальна калорійність.
+    """
+    order = [i for i in range(len(costs)) if costs[i] <= budget and calories[i] > 0]
+    order.sort(key=lambda i: ratio_key(int(costs[i]), int(calories[i])), reverse=True)
+    order_costs = [int(costs[i]) for i in order]
+    order_calories = [int(calories[i]) for i in order]
+    n = len(order)
+
+    prefix_costs = [0] * (n + 1)
+    prefix_calories = [0] * (n + 1)
+    for k in range(n):
+        prefix_costs[k + 1] = prefix_costs[k] + order_costs[k]
+        prefix_calories[k + 1] = prefix_calories[k] + order_calories[k]
+
+    best, best_taken = 0, None
+    # Вузол: (наступна страва, залишок бюджету, калорії, зв'язний список взятих страв)
+    stack: List[Tuple[int, int, int, object]] = [(0, budget, 0, None)]
+    while stack:
+        i, capacity, value, taken = stack.pop()
+        if value > best:
+            best, best_taken = value, taken
+        if i == n:
+            continue
+
+        # Дробова межа: цілі страви, поки вміщаються, та частина наступної
+        k = bisect.bisect_right(prefix_costs, prefix_costs[i] + capacity) - 1
+        bound = value + prefix_calories[k] - prefix_calories[i]
+        if k < n:
+            bound += (capacity - prefix_costs[k] + prefix_costs[i]) * order_calories[k] // order_costs[k]
+        if bound <= best:
+            continue
+
+        stack.append((i + 1, capacity, value, taken))
+        if order_costs[i] <= capacity:
+            # Гілка «взяти» обробляється першою, тож хороший розв'язок знаходиться швидко
+            stack.append((i + 1, capacity - order_costs[i], value + order_calories[i], (i, taken)))
+
+    selected: List[int] = []
+    while best_taken is not None:
+        i, best_taken = best_taken
+        selected.append(order[i])
+    return selected, best
+
+
+def choose_solver(piece_count: int, budget: int) -> str:
+    """
+    Обирає точний метод за розміром бюджету відносно кількості страв.
+
+    Таблиця ДП має piece_count × (budget + 1) клітинок; поки це не більше
+    DP_CELL_LIMIT, вона швидка й передбачувана. Для великих бюджетів таблиця
+    непридатна, і використовується метод гілок і меж.
+
+    Args:
+        piece_count (int): Кількість страв (частин після розбиття).
+        budget (int): Доступний бюджет.
+
+    Returns:
+        str: "dp" або "branch_and_bound".
+    """
+    return "dp" if piece_count * (budget + 1) <= DP_CELL_LIMIT else "branch_and_bound"
+
+
+def knapsack(
+    items: Dict[str, Dict[str, int]],
+    budget: int,
+    kind: str = "single",
+    solver: str = "auto",
+) -> Tuple[List[str], int]:
+    """
+    Точний вибір страв з підтримкою кратностей та автоматичним вибором методу.
+
+    Args:
+        items (Dict[str, Dict[str, int]]): Словник, що містить страви, їхню вартість, калорійність
+            і, для kind="bounded", необов'язкову кількість 'quantity'.
+        budget (int): Доступний бюджет.
+        kind (str): "single", "bounded" або "unbounded" (див. split_items).
+        solver (str): "auto", "dp" або "branch_and_bound".
+
+    Returns:
+        Tuple[List[str], int]: Список вибраних страв (страва повторюється стільки разів,
+            скільки її взято) та максимальна калорійність.
+    """
+    pieces = split_items(items, budget, kind)
+    if solver == "auto":
+        solver = choose_solver(len(pieces), budget)
+
+    costs = np.array([piece[2] for piece in pieces], dtype=np.int64)
+    calories = np.array([piece[3] for piece in pieces], dtype=np.int64)
+    if solver == "dp":
+        selected, total = select_items(costs, calories, budget)
+    elif solver == "branch_and_bound":
+        selected, total = branch_and_bound(costs, calories, budget)
+    else:
+        raise ValueError(f"unknown solver: {solver}")
+
+    selected_items: List[str] = []
+    for i in selected:
+        name, count = pieces[i][0], pieces[i][1]
+        selected_items.extend([name] * count)
+    return selected_items, total
+
+
+class KnapsackTable:
+    """
+    Таблиця ДП задачі 0/1, що відповідає на запити для будь-якого бюджету до поточного
+    та нарощується інкрементально при збільшенні бюджету.
+
+    Замість повної таблиці зберігаються бітова матриця рішень (блоками по стовпцях,
+    по одному блоку на кожне розширення), останній рядок ДП та «хвости» всіх рядків —
+    останні max_cost значень, яких достатньо, щоб дорахувати нові стовпці.
+
+    Атрибути:
+        names (List[str]): Назви страв у порядку словника.
+        costs (np.ndarray): Вартості страв.
+        calories (np.ndarray): Калорійності страв.
+        budget (int): Найбільший бюджет, для якого обчислено таблицю (-1 — порожня таблиця).
+        values (np.ndarray): Максимальна калорійність для кожного бюджету від 0 до budget.
+        extensions (int): Кількість розширень таблиці.
+    """
+    def __init__(self, items: Dict[str, Dict[str, int]]) -> None:
+        self.names: List[str] = list(items)
+        self.costs = np.array([info['cost'] for info in items.values()], dtype=np.int64)
+        self.calories = np.array([info['calories'] for info in items.values()], dtype=np.int64)
+        self.budget = -1
+        self.values = np.zeros(0, dtype=np.int64)
+        self.extensions = 0
+        self.width = max(int(self.costs.max(initial=0)), 1)
+        # Від'ємні бюджети недосяжні: хвости заповнюються «мінус нескінченністю»
+        self.tails = np.full((len(self.names) + 1, self.width), NEG_INF, dtype=np.int64)
+        self.block_starts: List[int] = []
+        self.blocks: List[np.ndarray] = []
+
+    def extend(self, budget: int) -> None:
+        """
+        Дораховує стовпці таблиці від self.budget + 1 до budget.
+
+        Args:
+            budget (int): Новий найбільший бюджет.
+        """
+        count = budget - self.budget
+        if count <= 0:
+            return
+        start = self.budget + 1
+        width = self.width
+        block = np.zeros((len(self.names), (count + 7) // 8), dtype=np.uint8)
+        previous = np.concatenate((self.tails[0], np.zeros(count, dtype=np.int64)))
+        new_tails = np.empty_like(self.tails)
+        new_tails[0] = previous[-width:]
+
+        for i, (cost, value) in enumerate(zip(self.costs.tolist(), self.calories.tolist())):
+            current = previous.copy()
+            candidate = previous[width - cost:width - cost + count] + value
+            take = candidate > previous[width:]
+            block[i] = np.packbits(take)
+            np.maximum(current[width:], candidate, out=current[width:])
+            current[:width] = self.tails[i + 1]
+            new_tails[i + 1] = current[-width:]
+            previous = current
+
+        self.tails = new_tails
+        self.values = np.concatenate((self.values, previous[width:]))
+        self.block_starts.append(start)
+        self.blocks.append(block)
+        self.budget = budget
+        self.extensions += 1
+
+    def taken(self, i: int, b: int) -> bool:
+        """
+        Повертає, чи взято страву i в оптимальному розв'язку для бюджету b на її рядку.
+
+        Args:
+            i (int): Індекс страви.
+            b (int): Бюджет.
+
+        Returns:
+            bool: True, якщо страва покращує результат для бюджету b.
+        """
+        k = bisect.bisect_right(self.block_starts, b) - 1
+        offset = b - self.block_starts[k]
+        return bool((self.blocks[k][i, offset >> 3] >> (7 - (offset & 7))) & 1)
+
+    def solve(self, budget: int) -> Tuple[List[str], int]:
+        """
+        Відновлює оптимальний набір для бюджету, за потреби розширюючи таблицю.
+
+        Args:
+            budget (int): Доступний бюджет.
+
+        Returns:
+            Tuple[List[str], int]: Список вибраних страв та максимальна калорійність.
+        """
+        if budget < 0 or not self.names:
+            return [], 0
+        self.extend(budget)
+        selected_items: List[str] = []
+        b = budget
+        for i in range(len(self.names) - 1, -1, -1):
+            if self.taken(i, b):
+                selected_items.append(self.names[i])
+                b -= int(self.costs[i])
+        return selected_items, int(self.values[budget])
+
+
+def items_key(items: Dict[str, Dict[str, int]]) -> str:
+    """
+    Обчислює хеш набору страв для кешу таблиць.
+
+    Порядок страв входить у ключ, бо від нього залежить порядок відновлених страв.
+
+    Args:
+        items (Dict[str, Dict[str, int]]): Словник, що містить страви, їхню вартість і калорійність.
+
+    Returns:
+        str: Шістнадцятковий дайджест набору страв.
+    """
+    data = repr([(name, info['cost'], info['calories']) for name, info in items.items()])
+    return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+
+def knapsack_table(items: Dict[str, Dict[str, int]], budget: int) -> KnapsackTable:
+    """
+    Повертає таблицю для набору страв з кешу, розширену щонайменше до budget.
+
+    Кеш обмежений TABLE_CACHE_SIZE записами й витісняє найдавніше використану таблицю.
+
+    Args:
+        items (Dict[str, Dict[str, int]]): Словник, що містить страви, їхню вартість і калорійність.
+        budget (int): Найбільший потрібний бюджет.
+
+    Returns:
+        KnapsackTable: Таблиця, обчислена щонайменше до budget.
+    """
+    key = items_key(items)
+    table = TABLE_CACHE.get(key)
+    if table is None:
+        table = KnapsackTable(items)
+        TABLE_CACHE[key] = table
+        if len(TABLE_CACHE) > TABLE_CACHE_SIZE:
+            TABLE_CACHE.popitem(last=False)
+    else:
+        TABLE_CACHE.move_to_end(key)
+    table.extend(budget)
+    return table
+
+
+def dynamic_programming_batch(items: Dict[str, Dict[str, int]], budgets: Iterable[int]) -> Dict[int, Tuple[List[str], int]]:
+    """
+    Розв'язує задачу для багатьох бюджетів одним проходом ДП до найбільшого з них.
+
+    Args:
+        items (Dict[str, Dict[str, int]]): Словник, що містить страви, їхню вартість і калорійність.
+        budgets (Iterable[int]): Бюджети, для яких потрібна відповідь.
+
+    Returns:
+        Dict[int, Tuple[List[str], int]]: Для кожного бюджету — список вибраних страв та максимальна калорійність.
+    """
+    budgets = list(budgets)
+    if not budgets:
+        return {}
+    table = knapsack_table(items, max(budgets))
+    return {b: table.solve(b) for b in budgets}
+
+
 # Приклад використання
 print("Жадібний алгоритм:", greedy_algorithm(items, budget))
 print("Алгоритм динамічного програмування:", dynamic_programming(items, budget))
+print("Динамічне програмування (NumPy):", dynamic_programming(items, budget, mode="numpy"))
+print("Без обмеження кількості:", knapsack(items, budget, kind="unbounded"))
+print("Метод гілок і меж:", knapsack(items, budget, solver="branch_and_bound"))
+print("Кілька бюджетів:", dynamic_programming_batch(items, [50, 75, 100]))
@@ -1,6 +1,17 @@
+import os
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
 import matplotlib.pyplot as plt
-from typing import Dict, Tuple
+import numpy as np
+
+# Кількість значень кубиків, що генеруються за один крок векторизованої симуляції
+CHUNK_SIZE: int = 2 ** 22
+
+# Довжина, до якої згортка обчислюється напряму, а не через FFT
+DIRECT_CONVOLVE_LIMIT: int = 64
 
 
 def roll_dice(num_rolls: int) -> Tuple[Dict[int, int], Dict[int, float]]:
@@ -31,17 +42,315 @@ def roll_dice(num_rolls: int) -> Tuple[Dict[int, int], Dict[int, float]]:
     return sums_count, probabilities
 
 
-def plot_probabilities(probabilities: Dict[int, float]) -> None:
+def sum_counts(
+    rng: np.random.Generator,
+    num_rolls: int,
+    dice: int = 2,
+    faces: int = 6,
+    chunk_size: int = CHUNK_SIZE,
+) -> np.ndarray:
+    """
+    Векторизовано симулює кидки блоками сталого розміру та підраховує суми через bincount.
+
+    Пам'ять не залежить від num_rolls: за раз генерується не більше chunk_size значень.
+
+    Args:
+        rng (np.random.Generator): Генератор випадкових чисел.
+        num_rolls (int): Кількість кидків.
+        dice (int): Кількість кубиків у кидку.
+        faces (int): Кількість граней кубика.
+        chunk_size (int): Максимальна кількість значень кубиків в одному блоці.
+
+    Returns:
+        np.ndarray: Кількість випадків кожної суми; індекс 0 відповідає сумі dice.
+    """
+    size = dice * (faces - 1) + 1
+    counts = np.zeros(size, dtype=np.int64)
+    # Найменший тип, у який вміщується сума, пришвидшує генерацію та додавання
+    dtype = np.uint8 if size <= 2 ** 8 else np.uint16 if size <= 2 ** 16 else np.int64
+    rolls_per_chunk = max(chunk_size // dice, 1)
+
+    remaining = num_rolls
+    while remaining > 0:
+        count = min(rolls_per_chunk, remaining)
+        # Значення 0..faces-1: сума одразу є індексом для bincount
+        values = rng.integers(0, faces, size=(dice, count), dtype=dtype)
+        totals = values.sum(axis=0, dtype=dtype) if dice > 1 else values[0]
+        counts += np.bincount(totals, minlength=size)
+        remaining -= count
+    return counts
+
+
+def counts_to_dicts(counts: np.ndarray, dice: int) -> Tuple[Dict[int, int], Dict[int, float]]:
+    """
+    Перетворює масив кількостей сум на словники у форматі roll_dice.
+
+    Args:
+        counts (np.ndarray): Кількість випадків кожної суми; індекс 0 відповідає сумі dice.
+        dice (int): Кількість кубиків у кидку.
+
+    Returns:
+        Tuple[Dict[int, int], Dict[int, float]]: Кількості та ймовірності кожної суми.
+    """
+    num_rolls = int(counts.sum())
+    sums_count: Dict[int, int] = {dice + i: int(c) for i, c in enumerate(counts.tolist())}
+    probabilities: Dict[int, float] = {k: v / num_rolls if num_rolls else 0.0 for k, v in sums_count.items()}
+    return sums_count, probabilities
+
+
+def roll_dice_numpy(
+    num_rolls: int,
+    dice: int = 2,
+    faces: int = 6,
+    seed: Union[int, np.random.Generator, None] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[Dict[int, int], Dict[int, float]]:
+    """
+    Векторизований аналог roll_dice для довільної кількості кубиків і граней.
+
+    Args:
+        num_rolls (int): Кількість симуляцій кидків кубиків.
+        dice (int): Кількість кубиків у кидку.
+        faces (int): Кількість граней кубика.
+        seed (Union[int, np.random.Generator, None]): Зерно або генератор для відтворюваності.
+        chunk_size (int): Максимальна кількість значень кубиків в одному блоці.
+
+    Returns:
+        Tuple[Dict[int, int], Dict[int, float]]:
+            - Словник з підрахунком кількості випадків для кожної суми.
+            - Словник із розрахованими ймовірностями кожної суми.
+    """
+    rng = np.random.default_rng(seed)
+    return counts_to_dicts(sum_counts(rng, num_rolls, dice, faces, chunk_size), dice)
+
+
+def convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Згортка двох розподілів: пряма для коротких масивів, через FFT — для довгих.
+
+    Args:
+        a (np.ndarray): Перший розподіл.
+        b (np.ndarray): Другий розподіл.
+
+    Returns:
+        np.ndarray: Розподіл суми незалежних величин.
+    """
+    if min(len(a), len(b)) <= DIRECT_CONVOLVE_LIMIT:
+        return np.convolve(a, b)
+    size = len(a) + len(b) - 1
+    result = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)
+    # Похибки округлення FFT дають крихітні від'ємні значення в хвостах
+    return np.clip(result, 0.0, None)
+
+
+def exact_distribution(dice: int = 2, faces: int = 6) -> np.ndarray:
+    """
+    Обчислює точний розподіл суми згорткою розподілів окремих кубиків.
+
+    Розподіл для dice кубиків будується піднесенням до степеня квадратуванням:
+    потрібно лише O(log dice) згорток, тож 1000 d20 обчислюються за мілісекунди.
+
+    Args:
+        dice (int): Кількість кубиків у кидку.
+        faces (int): Кількість граней кубика.
+
+    Returns:
+        np.ndarray: Ймовірності сум; індекс 0 відповідає сумі dice.
+    """
+    power = np.full(faces, 1.0 / faces)
+    distribution = np.ones(1)
+    while dice:
+        if dice & 1:
+            distribution = convolve(distribution, power)
+        dice >>= 1
+        if dice:
+            power = convolve(power, power)
+    return distribution
+
+
+def exact_probabilities(dice: int = 2, faces: int = 6) -> Dict[int, float]:
+    """
+    Точні ймовірності кожної суми у форматі ймовірностей roll_dice.
+
+    Args:
+        dice (int): Кількість кубиків у кидку.
+        faces (int): Кількість граней кубика.
+
+    Returns:
+        Dict[int, float]: Словник ймовірностей кожної суми.
+    """
+    return {dice + i: p for i, p in enumerate(exact_distribution(dice, faces).tolist())}
+
+
+def worker_counts(task: Tuple[np.random.SeedSequence, int, int, int, int]) -> np.ndarray:
+    """
+    Підраховує суми в окремому процесі з власним незалежним потоком випадкових чисел.
+
+    Args:
+        task (Tuple[np.random.SeedSequence, int, int, int, int]): Породжена SeedSequence,
+            кількість кидків, кубиків, граней і розмір блоку.
+
+    Returns:
+        np.ndarray: Кількість випадків кожної суми.
+    """
+    seed_sequence, num_rolls, dice, faces, chunk_size = task
+    return sum_counts(np.random.default_rng(seed_sequence), num_rolls, dice, faces, chunk_size)
+
+
+def parallel_counts(
+    executor: ProcessPoolExecutor,
+    seed_sequence: np.random.SeedSequence,
+    num_rolls: int,
+    workers: int,
+    dice: int,
+    faces: int,
+    chunk_size: int,
+) -> np.ndarray:
+    """
+    Розподіляє кидки між процесами, кожен з яких отримує потік, породжений від seed_sequence.
+
+    Args:
+        executor (ProcessPoolExecutor): Пул процесів.
+        seed_sequence (np.random.SeedSequence): Батьківська послідовність зерен.
+        num_rolls (int): Загальна кількість кидків.
+        workers (int): Кількість частин, на які ділиться робота.
+        dice (int): Кількість кубиків у кидку.
+        faces (int): Кількість граней кубика.
+        chunk_size (int): Максимальна кількість значень кубиків в одному блоці.
+
+    Returns:
+        np.ndarray: Об'єднана кількість випадків кожної суми.
+    """
+    shares = [num_rolls // workers + (i < num_rolls % workers) for i in range(workers)]
+    tasks = [(child, share, dice, faces, chunk_size) for child, share in zip(seed_sequence.spawn(workers), shares)]
+    counts = np.zeros(dice * (faces - 1) + 1, dtype=np.int64)
+    for partial in executor.map(worker_counts, tasks):
+        counts += partial
+    return counts
+
+
+def roll_dice_parallel(
+    num_rolls: int,
+    dice: int = 2,
+    faces: int = 6,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[Dict[int, int], Dict[int, float]]:
+    """
+    Симулює кидки паралельно в пулі процесів і об'єднує підрахунки.
+
+    Кожен процес отримує незалежний потік, породжений SeedSequence.spawn, тож
+    результат відтворюваний для однакових seed і workers.
+
+    Args:
+        num_rolls (int): Кількість симуляцій кидків кубиків.
+        dice (int): Кількість кубиків у кидку.
+        faces (int): Кількість граней кубика.
+        seed (Optional[int]): Зерно для відтворюваності.
+        workers (Optional[int]): Кількість процесів (за замовчуванням — кількість ядер).
+        chunk_size (int): Максимальна кількість значень кубиків в одному блоці.
+
+    Returns:
+        Tuple[Dict[int, int], Dict[int, float]]: Кількості та ймовірності кожної суми.
+    """
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = parallel_counts(executor, np.random.SeedSequence(seed), num_rolls, workers, dice, faces, chunk_size)
+    return counts_to_dicts(counts, dice)
+
+
+def roll_dice_adaptive(
+    tolerance: float,
+    dice: int = 2,
+    faces: int = 6,
+    criterion: str = "max_error",
+    seed: Optional[int] = None,
+    batch_rolls: int = 1_000_000,
+    max_rolls: int = 10 ** 9,
+    workers: int = 1,
+    z: float = 1.96,
+    verbose: bool = True,
+) -> Tuple[Dict[int, int], Dict[int, float], List[Dict[str, float]]]:
+    """
+    Симулює кидки порціями, доки похибка не стане меншою за tolerance.
+
+    Після кожної порції (контрольної точки) обчислюється похибка:
+    "max_error" — максимальне відхилення від точного розподілу,
+    "ci_width" — найбільша ширина довірчого інтервалу 2·z·√(p(1−p)/n).
+
+    Args:
+        tolerance (float): Допустима похибка.
+        dice (int): Кількість кубиків у кидку.
+        faces (int): Кількість граней кубика.
+        criterion (str): "max_error" або "ci_width".
+        seed (Optional[int]): Зерно для відтворюваності.
+        batch_rolls (int): Кількість кидків між контрольними точками.
+        max_rolls (int): Максимальна кількість кидків.
+        workers (int): Кількість процесів; 1 — без пулу процесів.
+        z (float): Квантиль нормального розподілу для довірчого інтервалу.
+        verbose (bool): Виводити контрольні точки.
+
+    Returns:
+        Tuple[Dict[int, int], Dict[int, float], List[Dict[str, float]]]: Кількості та ймовірності
+            кожної суми й контрольні точки з полями rolls, rolls_per_sec та error.
+    """
+    if criterion not in ("max_error", "ci_width"):
+        raise ValueError(f"unknown criterion: {criterion}")
+
+    exact = exact_distribution(dice, faces)
+    seed_sequence = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seed_sequence)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    counts = np.zeros(len(exact), dtype=np.int64)
+    checkpoints: List[Dict[str, float]] = []
+    total = 0
+    try:
+        while total < max_rolls:
+            batch = min(batch_rolls, max_rolls - total)
+            start = time.perf_counter()
+            if executor is not None:
+                counts += parallel_counts(executor, seed_sequence.spawn(1)[0], batch, workers, dice, faces, CHUNK_SIZE)
+            else:
+                counts += sum_counts(rng, batch, dice, faces)
+            elapsed = time.perf_counter() - start
+            total += batch
+
+            estimate = counts / total
+            if criterion == "max_error":
+                error = float(np.abs(estimate - exact).max())
+            else:
+                error = float((2 * z * np.sqrt(estimate * (1 - estimate) / total)).max())
+            checkpoints.append({"rolls": total, "rolls_per_sec": batch / elapsed, "error": error})
+            if verbose:
+                print(f"{total}\t{batch / elapsed:,.0f} кидків/с\tпохибка {error:.6f}")
+            if error < tolerance:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    sums_count, probabilities = counts_to_dicts(counts, dice)
+    return sums_count, probabilities, checkpoints
+
+
+def plot_probabilities(probabilities: Dict[int, float], exact: Optional[Dict[int, float]] = None) -> None:
     """
     Будує графік ймовірностей кожної суми, отриманої при симуляції кидання двох кубиків.
 
     Args:
         probabilities (Dict[int, float]): Словник ймовірностей кожної суми.
+        exact (Optional[Dict[int, float]]): Точні ймовірності (див. exact_probabilities)
+            для порівняння з симуляцією.
     """
     sums = list(probabilities.keys())
     probs = list(probabilities.values())
 
-    plt.bar(sums, probs, tick_label=sums)
+    # Підписи під кожним стовпцем лише тоді, коли їх можна прочитати
+    plt.bar(sums, probs, tick_label=sums if len(sums) <= 30 else None, label='Монте-Карло')
+    if exact is not None:
+        plt.plot(list(exact.keys()), list(exact.values()), color='red', marker='o', markersize=3, label='Точно')
+        plt.legend()
     plt.xlabel('Сума')
     plt.ylabel('Ймовірність')
     plt.title('Ймовірність суми при киданні двох кубиків (Метод Монте-Карло)')
@@ -49,16 +358,27 @@ def plot_probabilities(probabilities: Dict[int, float]) -> None:
     plt.show()
 
 
-# Параметри симуляції
-num_rolls: int = 100000  # Кількість кидків
+if __name__ == "__main__":
+    # Параметри симуляції
+    num_rolls: int = 100000  # Кількість кидків
+
+    # Запускаємо симуляцію
+    sums_count, probabilities = roll_dice(num_rolls)
+
+    # Виведення результатів у таблиці
+    print("Сума\tКількість\tЙмовірність")
+    for total, count in sums_count.items():
+        print(f"{total}\t{count}\t\t{probabilities[total]:.4f}")
 
-# Запускаємо симуляцію
-sums_count, probabilities = roll_dice(num_rolls)
+    # Векторизована симуляція з фіксованим зерном
+    _, fast_probabilities = roll_dice_numpy(10_000_000, seed=42)
+    print("\nNumPy, 10 000 000 кидків:")
+    for total, probability in fast_probabilities.items():
+        print(f"{total}\t{probability:.4f}")
 
-# Виведення результатів у таблиці
-print("Сума\tКількість\tЙмовірність")
-for total, count in sums_count.items():
-    print(f"{total}\t{count}\t\t{probabilities[total]:.4f}")
+    # Адаптивна симуляція: зупиняється, щойно відхилення від точного розподілу менше 0.0005
+    print("\nАдаптивна симуляція:")
+    roll_dice_adaptive(0.0005, seed=42)
 
-# Побудова графіку
-plot_probabilities(probabilities)
+    # Побудова графіку разом із точним розподілом
+    plot_probabilities(probabilities, exact_probabilities())